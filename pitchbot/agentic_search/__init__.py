@@ -6,5 +6,6 @@ from .query_generator import SearchQueryGenerator
 from .config import LlamaConfig
 from .brave_search import BraveSearchClient
 from .research_analyzer import ResearchAnalyzer
+from .research_cache import ResearchCache
 
-__all__ = ["SearchQueryGenerator", "LlamaConfig", "BraveSearchClient", "ResearchAnalyzer"] 
\ No newline at end of file
+__all__ = ["SearchQueryGenerator", "LlamaConfig", "BraveSearchClient", "ResearchAnalyzer", "ResearchCache"] 
\ No newline at end of file
@@ -27,6 +27,25 @@ class BraveSearchClient:
             "Accept-Encoding": "gzip",
             "X-Subscription-Token": self.api_key
         }
+        
+        # One pooled client for all searches so concurrent queries reuse connections
+        self._client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            timeout=30.0
+        )
+    
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close the pooled HTTP client."""
+        await self._client.aclose()
     
     async def search(self, query: str, count: int = 10, country: str = "US") -> Dict[str, Any]:
         """
@@ -53,15 +72,13 @@ class BraveSearchClient:
         }
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    self.base_url,
-                    headers=self.headers,
-                    params=params,
-                    timeout=30.0
-                )
-                response.raise_for_status()
-                return response.json()
+            response = await self._client.get(
+                self.base_url,
+                headers=self.headers,
+                params=params
+            )
+            response.raise_for_status()
+            return response.json()
                 
         except httpx.HTTPStatusError as e:
             raise RuntimeError(f"Brave Search API error {e.response.status_code}: {e.response.text}")
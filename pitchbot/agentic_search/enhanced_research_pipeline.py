@@ -8,6 +8,7 @@ from .brave_search import BraveSearchClient
 from .query_generator import SearchQueryGenerator
 from .research_analyzer import ResearchAnalyzer
 from .reference_extractor import ReferenceExtractor
+from .research_cache import ResearchCache
 
 
 class EnhancedResearchPipeline:
@@ -28,6 +29,12 @@ class EnhancedResearchPipeline:
             max_depth=max_depth,
             max_pages_per_level=max_pages_per_level
         )
+        self.cache = ResearchCache()
+    
+    async def aclose(self):
+        """Release the pooled search client and the research cache."""
+        await self.search_client.aclose()
+        self.cache.close()
     
     async def run_comprehensive_research(
         self,
@@ -51,7 +58,7 @@ class EnhancedResearchPipeline:
         
         # Step 1: Generate search queries
         print("📋 Step 1: Generating targeted search queries...")
-        search_queries = await self.query_generator.generate_queries(idea_summary)
+        search_queries = await self.cache.get_or_generate_queries(idea_summary, self.query_generator)
         print(f"✅ Generated {len(search_queries)} search queries")
         
         # Step 2: Execute searches
@@ -66,10 +73,7 @@ class EnhancedResearchPipeline:
         for i, query in enumerate(search_queries, 1):
             print(f"   Query {i}/{len(search_queries)}: {query}")
             try:
-                search_response = await self.search_client.search(
-                    query=query,
-                    count=max_search_results
-                )
+                search_response = await self.cache.get_or_search(query, max_search_results, self.search_client)
                 web_results = self.search_client.extract_web_results(search_response)
                 all_search_results.extend(web_results)
                 
@@ -235,11 +239,14 @@ async def research_startup_idea_comprehensive(
         max_pages_per_level=max_pages_per_level
     )
     
-    results = await pipeline.run_comprehensive_research(
-        idea_summary=idea_summary,
-        enable_reference_extraction=enable_reference_extraction,
-        max_search_results=max_search_results
-    )
+    try:
+        results = await pipeline.run_comprehensive_research(
+            idea_summary=idea_summary,
+            enable_reference_extraction=enable_reference_extraction,
+            max_search_results=max_search_results
+        )
+    finally:
+        await pipeline.aclose()
     
     # Print summary
     pipeline.print_comprehensive_summary(results)
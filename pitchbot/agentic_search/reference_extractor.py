@@ -11,6 +11,23 @@ from bs4 import BeautifulSoup
 import time
 
 
+def _bounded_text(node, limit: int = 8000) -> str:
+    """
+    Collect the visible text of a node, stopping once ``limit`` characters are gathered.
+    
+    Downstream consumers only ever look at the first few thousand characters of a
+    page, so there is no point materializing the full body text.
+    """
+    parts = []
+    length = 0
+    for text in node.stripped_strings:
+        parts.append(text)
+        length += len(text) + 1
+        if length >= limit:
+            break
+    return ' '.join(parts)[:limit]
+
+
 class ReferenceExtractor:
     """Handles extraction of references and multi-level web scraping."""
     
@@ -107,8 +124,8 @@ class ReferenceExtractor:
             main_content = soup.find('body')
         
         if main_content:
-            # Get text content
-            text = main_content.get_text(separator=' ', strip=True)
+            # Get text content (bounded, the rest is never used)
+            text = _bounded_text(main_content)
             # Clean up whitespace
             text = re.sub(r'\s+', ' ', text)
             return text.strip()
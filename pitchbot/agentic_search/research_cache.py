@@ -0,0 +1,102 @@
+"""
+On-disk cache for generated search queries and Brave search responses.
+"""
+
+import hashlib
+import os
+from typing import Optional, Dict, List, Any, TYPE_CHECKING
+
+import diskcache
+
+if TYPE_CHECKING:
+    from .brave_search import BraveSearchClient
+    from .query_generator import SearchQueryGenerator
+
+
+class ResearchCache:
+    """Exact-match cache keyed by normalized idea summaries and search queries."""
+
+    def __init__(self, directory: Optional[str] = None, expire: Optional[float] = 7 * 24 * 3600):
+        """
+        Initialize the research cache.
+
+        Args:
+            directory: Cache directory (defaults to $PITCHBOT_CACHE_DIR or ~/.pitchbot/research_cache)
+            expire: Seconds before a cached entry expires (None keeps entries forever)
+        """
+        directory = directory or os.getenv(
+            "PITCHBOT_CACHE_DIR",
+            os.path.join(os.path.expanduser("~"), ".pitchbot", "research_cache")
+        )
+        self.cache = diskcache.Cache(directory)
+        self.expire = expire
+
+    @staticmethod
+    def _key(namespace: str, text: str) -> str:
+        """Build a cache key from whitespace/case-normalized text."""
+        normalized = " ".join(text.lower().split())
+        return f"{namespace}:{hashlib.sha256(normalized.encode('utf-8')).hexdigest()}"
+
+    def get_queries(self, idea_summary: str) -> Optional[List[str]]:
+        """Return cached search queries for an idea summary, if any."""
+        return self.cache.get(self._key("queries", idea_summary))
+
+    def set_queries(self, idea_summary: str, queries: List[str]) -> None:
+        """Store generated search queries for an idea summary."""
+        self.cache.set(self._key("queries", idea_summary), queries, expire=self.expire)
+
+    def get_search(self, query: str, count: int) -> Optional[Dict[str, Any]]:
+        """Return a cached Brave search response, if any."""
+        return self.cache.get(self._key(f"search:{count}", query))
+
+    def set_search(self, query: str, count: int, search_response: Dict[str, Any]) -> None:
+        """Store a Brave search response."""
+        self.cache.set(self._key(f"search:{count}", query), search_response, expire=self.expire)
+
+    async def get_or_generate_queries(
+        self,
+        idea_summary: str,
+        query_generator: "SearchQueryGenerator"
+    ) -> List[str]:
+        """
+        Return cached search queries for an idea summary, generating and storing them on a miss.
+
+        Args:
+            idea_summary: Summary of the startup idea
+            query_generator: Generator used on a cache miss
+
+        Returns:
+            Search queries for the idea
+        """
+        queries = self.get_queries(idea_summary)
+        if queries is None:
+            queries = await query_generator.generate_queries(idea_summary)
+            self.set_queries(idea_summary, queries)
+        return queries
+
+    async def get_or_search(
+        self,
+        query: str,
+        count: int,
+        search_client: "BraveSearchClient"
+    ) -> Dict[str, Any]:
+        """
+        Return a cached Brave search response, running and storing the search on a miss.
+
+        Args:
+            query: Search query
+            count: Number of results requested
+            search_client: Client used on a cache miss
+
+        Returns:
+            Brave search response
+        """
+        search_response = self.get_search(query, count)
+        if search_response is None:
+            search_response = await search_client.search(query, count=count)
+            self.set_search(query, count, search_response)
+        return search_response
+
+    def close(self) -> None:
+        """Close the underlying cache."""
+        self.cache.close()
@@ -7,14 +7,39 @@ import asyncio
 import os
 import sys
 import json
+import logging
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List, Optional
 from dotenv import load_dotenv
 from .query_generator import SearchQueryGenerator
 from .brave_search import BraveSearchClient
 from .research_analyzer import ResearchAnalyzer
+from .research_cache import ResearchCache
+from ..log_utils import start_log_listener
 
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class ResearchData:
+    """Research results accumulated by StartupResearcher.conduct_research."""
+    idea_summary: str
+    search_queries: List[str] = field(default_factory=list)
+    web_results: List[Dict[str, Any]] = field(default_factory=list)
+    total_pages_analyzed: int = 0
+    analysis: str = ""
+    primary_queries: Optional[List[str]] = None
+    reference_based_queries: Optional[List[str]] = None
+    reference_extraction_data: Optional[Dict[str, Any]] = None
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Shallow dict view for consumers that take research data as a dictionary."""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
 class StartupResearcher:
     """Comprehensive startup research using query generation and web search."""
     
@@ -27,9 +52,19 @@ class StartupResearcher:
         )
         self.brave_client = BraveSearchClient()
         self.analyzer = ResearchAnalyzer()
+        self.cache = ResearchCache()
         self.enable_reference_extraction = enable_reference_extraction
     
-    async def conduct_research(self, idea_summary: str) -> dict:
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.brave_client.aclose()
+        self.cache.close()
+    
+    async def conduct_research(self, idea_summary: str) -> ResearchData:
         """
         Conduct comprehensive research on a startup idea.
         
@@ -37,40 +72,34 @@ class StartupResearcher:
             idea_summary: Summary of the startup idea
             
         Returns:
-            Dictionary containing all research data and analysis
+            ResearchData containing all research data and analysis
         """
-        research_data = {
-            "idea_summary": idea_summary,
-            "search_queries": [],
-            "web_results": [],
-            "total_pages_analyzed": 0,
-            "analysis": ""
-        }
+        research_data = ResearchData(idea_summary=idea_summary)
         
-        print("🔍 Step 1: Generating strategic search queries...")
+        logger.info("🔍 Step 1: Generating strategic search queries...")
         
         # Generate search queries (comprehensive if reference extraction is enabled)
         try:
             if self.enable_reference_extraction:
                 # First generate primary queries
-                primary_queries = await self.query_generator.generate_queries(idea_summary)
-                print(f"✅ Generated {len(primary_queries)} primary queries")
+                primary_queries = await self.cache.get_or_generate_queries(idea_summary, self.query_generator)
+                logger.info("✅ Generated %d primary queries", len(primary_queries))
                 
                 # Execute initial searches to get results for reference extraction
-                print(f"\n🔍 Executing initial searches for reference extraction...")
+                logger.info("🔍 Executing initial searches for reference extraction...")
                 initial_search_results = []
                 for i, query in enumerate(primary_queries[:3], 1):  # Use first 3 queries
                     try:
-                        print(f"  • Searching [{i}/3]: {query[:50]}...")
-                        search_response = await self.brave_client.search(query, count=5)
+                        logger.debug("  • Searching [%d/3]: %.50s...", i, query)
+                        search_response = await self.cache.get_or_search(query, 5, self.brave_client)
                         web_results = self.brave_client.extract_web_results(search_response)
                         initial_search_results.extend(web_results[:3])  # Top 3 results per query
-                        print(f"    ✅ Found {len(web_results)} results")
+                        logger.debug("    ✅ Found %d results", len(web_results))
                     except Exception as e:
-                        print(f"    ❌ Search failed: {str(e)}")
+                        logger.warning("    ❌ Search failed: %s", e)
                 
-                print(f"\n🔗 Starting comprehensive query generation with reference extraction...")
-                print(f"   • Initial search results collected: {len(initial_search_results)}")
+                logger.info("🔗 Starting comprehensive query generation with reference extraction...")
+                logger.info("   • Initial search results collected: %d", len(initial_search_results))
                 
                 # Now generate comprehensive queries with reference extraction
                 comprehensive_result = await self.query_generator.generate_comprehensive_queries(
@@ -79,14 +108,14 @@ class StartupResearcher:
                 )
                 
                 queries = comprehensive_result['primary_queries'] + comprehensive_result['reference_based_queries']
-                research_data["search_queries"] = queries
-                research_data["primary_queries"] = comprehensive_result['primary_queries']
-                research_data["reference_based_queries"] = comprehensive_result['reference_based_queries']
-                research_data["reference_extraction_data"] = comprehensive_result.get('reference_extraction_data')
+                research_data.search_queries = queries
+                research_data.primary_queries = comprehensive_result['primary_queries']
+                research_data.reference_based_queries = comprehensive_result['reference_based_queries']
+                research_data.reference_extraction_data = comprehensive_result.get('reference_extraction_data')
                 
-                print(f"✅ Generated {len(queries)} total queries")
-                print(f"   • Primary queries: {len(comprehensive_result['primary_queries'])}")
-                print(f"   • Reference-based queries: {len(comprehensive_result['reference_based_queries'])}")
+                logger.info("✅ Generated %d total queries", len(queries))
+                logger.info("   • Primary queries: %d", len(comprehensive_result['primary_queries']))
+                logger.info("   • Reference-based queries: %d", len(comprehensive_result['reference_based_queries']))
                 
                 # Print detailed reference extraction results
                 if comprehensive_result.get('reference_extraction_data'):
@@ -94,56 +123,63 @@ class StartupResearcher:
                 
             else:
                 # Generate basic queries
-                queries = await self.query_generator.generate_queries(idea_summary)
-                research_data["search_queries"] = queries
-                print(f"✅ Generated {len(queries)} search queries")
+                queries = await self.cache.get_or_generate_queries(idea_summary, self.query_generator)
+                research_data.search_queries = queries
+                logger.info("✅ Generated %d search queries", len(queries))
             
-            print(f"\n📋 All Generated Queries:")
-            for i, query in enumerate(queries, 1):
-                print(f"  {i}. {query}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("📋 All Generated Queries:")
+                for i, query in enumerate(queries, 1):
+                    logger.debug("  %d. %s", i, query)
         
         except Exception as e:
-            print(f"❌ Failed to generate queries: {e}")
+            logger.error("❌ Failed to generate queries: %s", e)
             return research_data
         
-        print(f"\n🌐 Step 2: Executing web searches for each query...")
+        logger.info("🌐 Step 2: Executing web searches for each query...")
+        
+        # Execute searches for all queries concurrently
+        search_responses = await asyncio.gather(
+            *[self.cache.get_or_search(query, 10, self.brave_client) for query in queries],
+            return_exceptions=True
+        )
         
-        # Execute searches for each query
-        for i, query in enumerate(queries, 1):
-            print(f"\n🔍 Searching [{i}/{len(queries)}]: {query[:60]}...")
+        # One slot per query, filled by position; failed queries leave their slot empty
+        query_blocks: List[Optional[Dict[str, Any]]] = [None] * len(queries)
+        total_pages = 0
+        
+        for i, (query, search_response) in enumerate(zip(queries, search_responses)):
+            logger.debug("🔍 Searched [%d/%d]: %.60s...", i + 1, len(queries), query)
             
-            try:
-                search_response = await self.brave_client.search(query, count=10)
-                web_results = self.brave_client.extract_web_results(search_response)
-                
-                query_data = {
-                    "query": query,
-                    "results_count": len(web_results),
-                    "results": web_results
-                }
-                
-                research_data["web_results"].append(query_data)
-                research_data["total_pages_analyzed"] += len(web_results)
-                
-                print(f"  ✅ Found {len(web_results)} results")
-                
-                
-            except Exception as e:
-                print(f"  ❌ Search failed: {e}")
+            if isinstance(search_response, Exception):
+                logger.warning("  ❌ Search failed for %.60s: %s", query, search_response)
                 # Continue with other queries even if one fails
                 continue
+            
+            web_results = self.brave_client.extract_web_results(search_response)
+            query_blocks[i] = {
+                "query": query,
+                "results_count": len(web_results),
+                "results": web_results
+            }
+            total_pages += len(web_results)
+            
+            logger.debug("  ✅ Found %d results", len(web_results))
+        
+        research_data.web_results = [block for block in query_blocks if block is not None]
+        research_data.total_pages_analyzed = total_pages
         
-        print(f"\n📊 Step 3: Analyzing collected data...")
-        print(f"  📄 Total pages analyzed: {research_data['total_pages_analyzed']}")
+        logger.info("📊 Step 3: Analyzing collected data...")
+        logger.info("  📄 Total pages analyzed: %d", research_data.total_pages_analyzed)
         
         # Generate comprehensive analysis using dedicated analyzer
         try:
-            analysis = await self.analyzer.analyze_research(idea_summary, research_data)
-            research_data["analysis"] = analysis
-            print(f"  ✅ Investment analysis completed")
+            analysis = await self.analyzer.analyze_research(idea_summary, research_data.as_dict())
+            research_data.analysis = analysis
+            logger.info("  ✅ Investment analysis completed")
             
         except Exception as e:
-            print(f"  ❌ Analysis failed: {e}")
+            logger.error("  ❌ Analysis failed: %s", e)
         
         return research_data
     
@@ -209,27 +245,27 @@ class StartupResearcher:
         
         print(f"\n" + "="*80)
     
-    def print_research_summary(self, research_data: dict) -> None:
+    def print_research_summary(self, research_data: ResearchData) -> None:
         """Print a formatted summary of the research results."""
         
-        if research_data['analysis']:
+        if research_data.analysis:
             # Use the analyzer's dedicated print method for better formatting
-            self.analyzer.print_analysis_summary(research_data['idea_summary'], research_data, research_data['analysis'])
+            self.analyzer.print_analysis_summary(research_data.idea_summary, research_data.as_dict(), research_data.analysis)
         else:
             print("\n" + "="*100)
             print("📊 COMPREHENSIVE STARTUP RESEARCH REPORT")
             print("="*100)
             
             print(f"\n💡 ORIGINAL IDEA:")
-            print(f"   {research_data['idea_summary']}")
+            print(f"   {research_data.idea_summary}")
             
             print(f"\n🔍 RESEARCH SCOPE:")
-            print(f"   • Search Queries Generated: {len(research_data['search_queries'])}")
-            print(f"   • Total Web Pages Analyzed: {research_data['total_pages_analyzed']}")
-            print(f"   • Average Results per Query: {research_data['total_pages_analyzed'] / len(research_data['search_queries']):.1f}")
+            print(f"   • Search Queries Generated: {len(research_data.search_queries)}")
+            print(f"   • Total Web Pages Analyzed: {research_data.total_pages_analyzed}")
+            print(f"   • Average Results per Query: {research_data.total_pages_analyzed / len(research_data.search_queries):.1f}")
             
             print(f"\n📋 SEARCH QUERIES USED:")
-            for i, query in enumerate(research_data['search_queries'], 1):
+            for i, query in enumerate(research_data.search_queries, 1):
                 print(f"   {i}. {query}")
             
             print(f"\n❌ Analysis could not be completed.")
@@ -319,10 +355,10 @@ async def main() -> int:
         print("⚖️  COMPARISON SUMMARY")
         print("="*80)
         
-        basic_queries = len(basic_research_data.get('search_queries', []))
-        enhanced_queries = len(enhanced_research_data.get('search_queries', []))
-        basic_pages = basic_research_data.get('total_pages_analyzed', 0)
-        enhanced_pages = enhanced_research_data.get('total_pages_analyzed', 0)
+        basic_queries = len(basic_research_data.search_queries)
+        enhanced_queries = len(enhanced_research_data.search_queries)
+        basic_pages = basic_research_data.total_pages_analyzed
+        enhanced_pages = enhanced_research_data.total_pages_analyzed
         
         print(f"📊 Query Generation:")
         print(f"   • Basic Mode: {basic_queries} queries")
@@ -333,14 +369,14 @@ async def main() -> int:
         print(f"   • Basic Mode: {basic_pages} pages analyzed")
         print(f"   • Enhanced Mode: {enhanced_pages} pages analyzed")
         
-        if enhanced_research_data.get('reference_based_queries'):
+        if enhanced_research_data.reference_based_queries:
             print(f"\n🔗 Reference-based Queries Generated:")
-            for i, query in enumerate(enhanced_research_data['reference_based_queries'], 1):
+            for i, query in enumerate(enhanced_research_data.reference_based_queries, 1):
                 print(f"   {i}. {query}")
         
         # Show reference extraction summary if available
-        if enhanced_research_data.get('reference_extraction_data'):
-            ref_data = enhanced_research_data['reference_extraction_data']
+        if enhanced_research_data.reference_extraction_data:
+            ref_data = enhanced_research_data.reference_extraction_data
             if ref_data.get('reference_extraction'):
                 ref_summary = ref_data['reference_extraction']['summary']
                 print(f"\n📊 Reference Extraction Summary:")
@@ -357,7 +393,23 @@ async def main() -> int:
         import traceback
         traceback.print_exc()
         return 1
+    finally:
+        await researcher_basic.__aexit__(None, None, None)
+        await researcher_enhanced.__aexit__(None, None, None)
 
 
 if __name__ == "__main__":
-    sys.exit(asyncio.run(main())) 
\ No newline at end of file
+    # uvloop makes the many small awaits in the research fan-out cheaper
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
+    listener = start_log_listener(logger)
+    try:
+        exit_code = asyncio.run(main())
+    finally:
+        # Flush queued log records before exiting
+        listener.stop()
+    sys.exit(exit_code) 
\ No newline at end of file
@@ -0,0 +1,933 @@
+"""
+FastAPI application for PitchBot.
+
+Kept apart from the command-line entry point so that only `pitchbot serve`
+pays for importing FastAPI and the processing pipelines.
+"""
+
+import sys
+import asyncio
+import importlib.util
+import logging
+import logging.handlers
+from typing import Optional, Union
+import json
+import os
+from datetime import datetime
+
+from fastapi import FastAPI, File, UploadFile, Form, HTTPException
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
+from dotenv import load_dotenv
+# Add LLAMA API client import
+from llama_api_client import AsyncLlamaAPIClient
+
+# Optional orjson for serializing the large analysis responses; ORJSONResponse
+# imports it itself, so only its availability is checked here
+ORJSON_AVAILABLE = importlib.util.find_spec("orjson") is not None
+
+# Load environment variables from .env file in the root directory
+load_dotenv()
+
+# Import the processors
+from .video_processor import process_video, warm_up as warm_up_video_processor
+from .pdf_processor import process_pdf
+from .url_processor import process_url
+from .code_analyzer_agent.llama_client import LlamaClient
+from .code_analyzer_agent.agent import close_context_caches
+from .company_url_processor import process_company_url
+from .log_utils import start_log_listener
+
+# Import agentic search components
+from .agentic_search.enhanced_research_pipeline import EnhancedResearchPipeline
+
+# Import rubric scoring
+import re
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+from utils.rubric_scoring import RubricScorer
+
+logger = logging.getLogger(__name__)
+
+# PITCHBOT_DEBUG=1 logs debug details, including the full module results, for each request
+DEBUG_LOGGING = os.getenv("PITCHBOT_DEBUG", "0") == "1"
+
+# Video and PDF processing are CPU-heavy; at most this many run at once across
+# all requests in a worker process, while the URL processors stay fully concurrent
+MAX_CONCURRENT_HEAVY_PROCESSORS = max(1, (os.cpu_count() or 1) // 2)
+_heavy_processor_semaphore = asyncio.Semaphore(MAX_CONCURRENT_HEAVY_PROCESSORS)
+
+
+class StartupResearcher:
+    """Enhanced startup research with multi-level reference extraction."""
+    
+    def __init__(self, enable_reference_extraction: bool = True, max_depth: int = 2, max_pages_per_level: int = 5):
+        """Initialize the enhanced research pipeline."""
+        self.pipeline = EnhancedResearchPipeline(
+            max_depth=max_depth,
+            max_pages_per_level=max_pages_per_level
+        )
+        self.enable_reference_extraction = enable_reference_extraction
+    
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.pipeline.aclose()
+    
+    async def conduct_research(self, idea_summary: str) -> dict:
+        """
+        Conduct comprehensive research using enhanced pipeline.
+        
+        Args:
+            idea_summary: Summary of the startup idea
+            
+        Returns:
+            Dictionary containing all research data and analysis in a compatible format
+        """
+        logger.info("🔍 Starting Enhanced Agentic Market Research...")
+        
+        # Run the enhanced research pipeline
+        results = await self.pipeline.run_comprehensive_research(
+            idea_summary=idea_summary,
+            enable_reference_extraction=self.enable_reference_extraction,
+            max_search_results=10
+        )
+        
+        # Convert enhanced results to the format expected by your FastAPI endpoint
+        research_data = {
+            "idea_summary": results["idea_summary"],
+            "search_queries": results["search_queries"],
+            "web_results": results["search_results"]["web_results"],
+            "total_pages_analyzed": results["pipeline_summary"]["total_pages_analyzed"],
+            "analysis": results["analysis"],
+            # Additional enhanced data
+            "enhanced_references": results.get("enhanced_references"),
+            "pipeline_summary": results["pipeline_summary"]
+        }
+        
+        return research_data
+
+
+# --- LLAMA API Summarization Functions ---
+class ModuleSummarizer:
+    """Handles LLAMA API summarization for each module."""
+    
+    def __init__(self):
+        """Initialize the LLAMA API client for summarization."""
+        api_key = os.getenv("LLAMA_API_KEY")
+        if not api_key:
+            raise ValueError("LLAMA_API_KEY environment variable not set.")
+        
+        self.client = AsyncLlamaAPIClient(
+            api_key=api_key,
+        )
+        self.model = "Llama-4-Maverick-17B-128E-Instruct-FP8"
+    
+    async def summarize_module_result(self, module_name: str, module_result: str) -> str:
+        """
+        Summarize a module's analysis result using LLAMA API.
+        
+        Args:
+            module_name: Name of the module (e.g., "Video Analysis", "PDF Analysis")
+            module_result: The raw analysis result from the module
+            
+        Returns:
+            Summarized version of the module result
+        """
+        if not module_result or not module_result.strip():
+            return "No content available for summarization."
+        
+        prompt = f"""You are an expert startup analyst. Summarize the following {module_name} results from an investor’s perspective.
+
+**Instructions:**
+- Focus on the most important insights and takeaways
+- Clearly highlight key strengths and red flags
+- Be concise, objective, and investment-focused
+- Use bullet points for clarity
+- Limit to 300 words
+- Do not include any headings like “Summary” or “Here’s the summary”
+
+**{module_name} Results to Summarize:**
+{module_result}
+"""
+
+        try:
+            response = await self.client.chat.completions.create(
+                messages=[
+                    {"role": "user", "content": prompt}
+                ],
+                model=self.model,
+                max_completion_tokens=200,
+                temperature=0.3
+            )
+            
+            summary = response.completion_message.content.text.strip()
+            
+            return summary
+            
+        except Exception as e:
+            logger.error("❌ LLAMA summarization failed for %s: %s", module_name, e)
+            return f"Summarization failed: {str(e)}"
+
+
+# Initialize the module summarizer
+summarizer = None
+
+async def get_summarizer():
+    """Get or create the module summarizer instance."""
+    global summarizer
+    if summarizer is None:
+        try:
+            summarizer = ModuleSummarizer()
+        except Exception as e:
+            logger.warning("⚠️ Could not initialize LLAMA summarizer: %s", e)
+            return None
+    return summarizer
+
+
+async def _run_module(index: int, processing, results: list) -> None:
+    """Await a module's processing into results[index], storing the exception if it fails."""
+    try:
+        results[index] = await processing
+    except Exception as e:
+        logger.error("❌ Module %d failed: %s", index + 1, e)
+        results[index] = e
+    logger.info("✅ Module %d/%d finished.", index + 1, len(results))
+
+
+async def _review_module(module_task: asyncio.Task, index: int, label: str, results: list, reviews: list) -> None:
+    """Once a module's task finishes, store its LLAMA summary and rubric scores in reviews[index]."""
+    await module_task
+    result = results[index]
+    # A failed module has nothing to summarize or score
+    if isinstance(result, Exception):
+        return
+    reviews[index] = await asyncio.gather(
+        add_module_summary(label, result),
+        add_rubric_scores(result, label)
+    )
+
+
+async def _research_modules(module_tasks: list, module_specs: list, results: list) -> Optional[dict]:
+    """
+    Once every module's task finishes, run market research on their combined results.
+    
+    Returns:
+        Research data, or None if every module failed
+    """
+    await asyncio.gather(*module_tasks)
+    if all(isinstance(result, Exception) for result in results):
+        logger.warning("⚠️ Every module failed; skipping agentic market research.")
+        return None
+    logger.info("\n🔍 Step 4: Conducting agentic market research based on combined analysis...")
+    
+    # Create a combined summary from all processing results, joined once at the end
+    summary_parts = ["STARTUP PITCH ANALYSIS SUMMARY:\n\n"]
+    for spec, result in zip(module_specs, results):
+        if not isinstance(result, Exception):
+            summary_parts.append(f"{spec['heading']}:\n{result}\n\n")
+    
+    return await conduct_market_research("".join(summary_parts))
+
+
+# Market researcher shared by all requests, so its search client, LLAMA clients
+# and research cache are set up once rather than per pitch
+researcher = None
+
+def get_researcher() -> StartupResearcher:
+    """Get or create the shared market researcher instance."""
+    global researcher
+    if researcher is None:
+        researcher = StartupResearcher()
+    return researcher
+
+
+async def _run_heavy_processor(processor, *args) -> str:
+    """Run a CPU-heavy processor once a heavy-processing slot is free."""
+    async with _heavy_processor_semaphore:
+        return await processor(*args)
+
+
+async def conduct_market_research(combined_summary: str) -> dict:
+    """
+    Run agentic market research on the combined module results.
+    
+    Args:
+        combined_summary: Summary built from all processed modules
+        
+    Returns:
+        Research data, or a dict with an "error" key if the research failed
+    """
+    try:
+        research_data = await get_researcher().conduct_research(combined_summary)
+        logger.info("✅ Agentic market research completed.")
+        return research_data
+    except Exception as e:
+        logger.error("❌ Agentic search failed: %s", e)
+        return {"error": f"Agentic search failed: {str(e)}"}
+
+
+async def add_module_summary(module_name: str, module_result: str) -> Optional[str]:
+    """
+    Add LLAMA API summary to a module result.
+    
+    Args:
+        module_name: Name of the module for summarization
+        module_result: The module's analysis result
+        
+    Returns:
+        Summary string or None if summarization fails
+    """
+    try:
+        logger.info("🤖 Generating LLAMA summary for %s...", module_name)
+        summarizer_instance = await get_summarizer()
+        
+        if summarizer_instance is None:
+            logger.warning("⚠️ Summarizer not available for %s", module_name)
+            return None
+            
+        summary = await summarizer_instance.summarize_module_result(module_name, module_result)
+        logger.info("✅ %s LLAMA summary completed!", module_name)
+        return summary
+        
+    except Exception as e:
+        logger.error("❌ %s LLAMA summarization failed: %s", module_name, e)
+        return None
+
+
+# --- Rubric Scoring Functions ---
+async def add_rubric_scores(content: str, module_name: str) -> dict:
+    """
+    Score content using rubric scorer and return structured results.
+    
+    Args:
+        content: The content to score
+        module_name: Name of the module for logging
+        
+    Returns:
+        Dictionary containing rubric scores or None if scoring fails
+    """
+    try:
+        logger.info("🎯 Scoring %s with rubric system...", module_name)
+        scorer = RubricScorer()
+        rubric_scores = await scorer.score(content)
+        
+        # Calculate average score for summary
+        total_score = sum(rubric_scores[key]['score'] for key in rubric_scores if 'score' in rubric_scores[key])
+        avg_score = total_score / 4 if len(rubric_scores) >= 4 else 0
+        
+        logger.info("✅ %s rubric scoring completed! Average: %.1f/100", module_name, avg_score)
+        return rubric_scores
+        
+    except Exception as e:
+        logger.error("❌ %s rubric scoring failed: %s", module_name, e)
+        return {
+            "impact": {"score": 0, "justification": f"Scoring failed: {str(e)}"},
+            "demo": {"score": 0, "justification": f"Scoring failed: {str(e)}"},
+            "creativity": {"score": 0, "justification": f"Scoring failed: {str(e)}"},
+            "pitch": {"score": 0, "justification": f"Scoring failed: {str(e)}"}
+        }
+
+
+# --- Text Formatting Functions ---
+def format_llama_summary(summary_text: str) -> str:
+    """
+    Format llama summary text by converting markdown-style formatting to clean, readable text.
+    Converts to HTML with proper structure for frontend display.
+    
+    Args:
+        summary_text: The raw llama summary text with markdown formatting
+        
+    Returns:
+        HTML formatted text with proper structure
+    """
+    if not summary_text:
+        return ""
+    
+    try:
+        # Start with clean text
+        formatted_text = summary_text.strip()
+        
+        # Convert markdown bold headers to HTML headers
+        formatted_text = re.sub(r'\*\*([^*]+):\*\*', r'<h4>\1:</h4>', formatted_text)
+        
+        # Convert bullet points to proper HTML list items
+        # First, identify bullet point sections
+        lines = formatted_text.split('\n')
+        html_lines = []
+        in_list = False
+        
+        for line in lines:
+            line = line.strip()
+            if not line:
+                if in_list:
+                    html_lines.append('</ul>')
+                    in_list = False
+                html_lines.append('<br>')
+                continue
+                
+            # Check if line is a bullet point
+            if re.match(r'^\* ', line):
+                if not in_list:
+                    html_lines.append('<ul>')
+                    in_list = True
+                # Clean up the bullet point and add as list item
+                bullet_text = re.sub(r'^\* ', '', line)
+                bullet_text = re.sub(r'\*\*([^*]+)\*\*', r'<strong>\1</strong>', bullet_text)
+                html_lines.append(f'<li>{bullet_text}</li>')
+            else:
+                if in_list:
+                    html_lines.append('</ul>')
+                    in_list = False
+                # Handle regular text (possibly headers)
+                if '<h4>' in line:
+                    html_lines.append(line)
+                else:
+                    # Clean up any remaining asterisks
+                    line = re.sub(r'\*\*([^*]+)\*\*', r'<strong>\1</strong>', line)
+                    html_lines.append(f'<p>{line}</p>')
+        
+        # Close any remaining list
+        if in_list:
+            html_lines.append('</ul>')
+        
+        formatted_html = '\n'.join(html_lines)
+        
+        # Clean up multiple consecutive line breaks
+        formatted_html = re.sub(r'(<br>\s*){2,}', '<br>', formatted_html)
+        
+        return formatted_html
+        
+    except Exception as e:
+        logger.warning("⚠️ Error formatting llama summary: %s", e)
+        # Fallback to simple text formatting
+        try:
+            simple_format = summary_text
+            simple_format = re.sub(r'\*\*([^*]+):\*\*', r'\1:', simple_format)
+            simple_format = re.sub(r'^\* ', '• ', simple_format, flags=re.MULTILINE)
+            simple_format = re.sub(r'\*\*([^*]+)\*\*', r'\1', simple_format)
+            return simple_format
+        except:
+            return summary_text
+
+
+# --- Domain Extraction Functions ---
+def extract_domain_from_company_analysis(result_text: str) -> str:
+    """
+    Extract the domain/industry from company analysis result text.
+    
+    Args:
+        result_text: The company analysis result string
+        
+    Returns:
+        Extracted domain or "Unknown" if not found
+    """
+    try:
+        # Convert to string if not already
+        text = str(result_text)
+        
+        # Look for various domain patterns
+        domain_patterns = [
+            r"Domain:\s*([^\n\r]+)",
+            r"Industry:\s*([^\n\r]+)", 
+            r"Sector:\s*([^\n\r]+)",
+            r"Field:\s*([^\n\r]+)",
+            r"Business Domain:\s*([^\n\r]+)",
+            r"Company Domain:\s*([^\n\r]+)"
+        ]
+        
+        for pattern in domain_patterns:
+            match = re.search(pattern, text, re.IGNORECASE)
+            if match:
+                domain = match.group(1).strip()
+                # Clean up common prefixes/suffixes
+                domain = re.sub(r'^[:\-\s]+|[:\-\s]+$', '', domain)
+                if domain and domain.lower() not in ['unknown', 'n/a', 'not specified']:
+                    return domain
+        
+        # If no explicit domain found, try to infer from common keywords
+        business_keywords = {
+            'software': 'Technology/Software',
+            'ai': 'Artificial Intelligence',
+            'tech': 'Technology', 
+            'health': 'Healthcare',
+            'medical': 'Healthcare',
+            'finance': 'Financial Services',
+            'fintech': 'Financial Technology',
+            'ecommerce': 'E-commerce',
+            'retail': 'Retail',
+            'education': 'Education',
+            'edtech': 'Educational Technology',
+            'marketing': 'Marketing',
+            'consulting': 'Consulting',
+            'manufacturing': 'Manufacturing',
+            'logistics': 'Logistics',
+            'energy': 'Energy',
+            'real estate': 'Real Estate',
+            'food': 'Food & Beverage',
+            'entertainment': 'Entertainment',
+            'media': 'Media',
+            'gaming': 'Gaming',
+            'automotive': 'Automotive',
+            'blockchain': 'Blockchain/Crypto',
+            'cryptocurrency': 'Blockchain/Crypto'
+        }
+        
+        text_lower = text.lower()
+        for keyword, domain in business_keywords.items():
+            if keyword in text_lower:
+                return domain
+                
+        return "Unknown"
+        
+    except Exception as e:
+        logger.warning("⚠️ Error extracting domain: %s", e)
+        return "Unknown"
+
+
+# --- JSON Storage Functions ---
+def save_analysis_to_json(analysis_data: dict, json_file_path: str = "pitch_analysis_history.json") -> None:
+    """
+    Save analysis data to a JSON file as a list of dictionaries.
+    Each API call appends a new dictionary to the list.
+    
+    Args:
+        analysis_data: The complete analysis dictionary to save
+        json_file_path: Path to the JSON file (defaults to pitch_analysis_history.json)
+    """
+    try:
+        # Add timestamp to the data
+        timestamped_data = {
+            "timestamp": datetime.now().isoformat(),
+            "data": analysis_data
+        }
+        
+        # Check if file exists and load existing data
+        if os.path.exists(json_file_path):
+            try:
+                with open(json_file_path, 'r', encoding='utf-8') as f:
+                    existing_data = json.load(f)
+                    
+                # Ensure existing_data is a list
+                if not isinstance(existing_data, list):
+                    existing_data = []
+            except (json.JSONDecodeError, IOError):
+                logger.warning("⚠️ Could not read existing JSON file. Creating new one.")
+                existing_data = []
+        else:
+            existing_data = []
+        
+        # Append new data
+        existing_data.append(timestamped_data)
+        
+        # Save back to file
+        with open(json_file_path, 'w', encoding='utf-8') as f:
+            json.dump(existing_data, f, indent=2, ensure_ascii=False)
+        
+        logger.info("✅ Analysis saved to %s (Total records: %d)", json_file_path, len(existing_data))
+        
+    except Exception as e:
+        logger.error("❌ Failed to save analysis to JSON: %s", e)
+
+
+# --- FastAPI Application ---
+app = FastAPI(
+    title="PitchBot API",
+    description="API for processing and analyzing startup pitches.",
+    version="0.1.0",
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+)
+
+# Enable CORS
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],  # Allows all origins
+    allow_credentials=True,
+    allow_methods=["*"],  # Allows all methods
+    allow_headers=["*"],  # Allows all headers
+)
+
+# Background thread writing this module's log records, started with the app
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+@app.on_event("startup")
+async def warm_up_clients():
+    """
+    Start the log listener, make a one-token LLAMA call at startup so DNS,
+    TLS and auth are done before the first pitch arrives, set up the shared
+    market researcher and load the Whisper model.
+    """
+    global _log_listener
+    if _log_listener is None:
+        _log_listener = start_log_listener(logger, logging.DEBUG if DEBUG_LOGGING else logging.INFO)
+
+    try:
+        get_researcher()
+    except Exception as e:
+        # Requests will retry and report the failure in their market research entry
+        logger.warning("⚠️ Could not initialize market researcher: %s", e)
+
+    # Loading the Whisper model takes seconds; do it before the first video arrives
+    try:
+        await asyncio.to_thread(warm_up_video_processor)
+        logger.info("✅ Whisper model loaded")
+    except Exception as e:
+        logger.warning("⚠️ Whisper warm-up failed: %s", e)
+
+    summarizer_instance = await get_summarizer()
+    if summarizer_instance is None:
+        return
+
+    try:
+        await summarizer_instance.client.chat.completions.create(
+            messages=[{"role": "user", "content": "ping"}],
+            model=summarizer_instance.model,
+            max_completion_tokens=1
+        )
+        logger.info("✅ LLAMA client warmed up")
+    except Exception as e:
+        # The app still works; the first request just pays the connection cost
+        logger.warning("⚠️ LLAMA warm-up failed: %s", e)
+
+@app.on_event("shutdown")
+async def close_clients():
+    """Close the pooled HTTP sessions and caches shared across requests."""
+    await LlamaClient.close_shared_session()
+    if researcher is not None:
+        await researcher.pipeline.aclose()
+    close_context_caches()
+    
+    # Flush any queued log records
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+@app.get("/pitch-history/")
+async def get_pitch_history():
+    """
+    Get pitch analysis history with structured data.
+    Returns a list of dictionaries containing timestamp, module analyses, and rubric scores.
+    """
+    try:
+        # Check if the history file exists
+        if not os.path.exists("pitch_analysis_history.json"):
+            return {"message": "No pitch history found", "data": []}
+        
+        # Read the history file
+        with open("pitch_analysis_history.json", 'r', encoding='utf-8') as f:
+            history_data = json.load(f)
+        
+        # If not a list, convert to list
+        if not isinstance(history_data, list):
+            history_data = []
+        
+        # Extract and restructure the data
+        structured_history = []
+        
+        for entry in history_data:
+            timestamp = entry.get("timestamp", "")
+            analysis_data = entry.get("data", {}).get("analysis", {})
+            modules_data = analysis_data.get("modules", {})
+            
+            # Create structured entry
+            structured_entry = {
+                "timestamp": timestamp
+            }
+            
+            # Extract data for each module type
+            module_mapping = {
+                "pdf_analysis": "pdf",
+                "video_analysis": "video", 
+                "github_analysis": "github",
+                "company_analysis": "company_website",
+                "market_research": "agentic_research"
+            }
+            
+            for module_key, module_name in module_mapping.items():
+                if module_key in modules_data:
+                    module_data = modules_data[module_key]
+                    
+                    # Extract analysis text
+                    analysis_text = ""
+                    if "result" in module_data:
+                        analysis_text = str(module_data["result"])
+                    elif "analysis" in module_data:
+                        analysis_text = str(module_data["analysis"])
+                    
+                    # Extract llama summary
+                    raw_llama_summary = module_data.get("llama_summary", "")
+                    formatted_llama_summary = format_llama_summary(raw_llama_summary) if raw_llama_summary else ""
+                    
+                    # Extract rubric scores
+                    rubric_scores = module_data.get("rubric_scores", {})
+                    
+                    # Structure module data
+                    module_entry = {
+                        "analysis": analysis_text,
+                        "llama_summary": formatted_llama_summary,
+                        "impact": rubric_scores.get("impact", {}).get("score", 0),
+                        "demo": rubric_scores.get("demo", {}).get("score", 0),
+                        "creativity": rubric_scores.get("creativity", {}).get("score", 0),
+                        "pitch": rubric_scores.get("pitch", {}).get("score", 0)
+                    }
+                    
+                    # Add domain for company analysis
+                    if module_name == "company_website" and "domain" in module_data:
+                        module_entry["domain"] = module_data["domain"]
+                    
+                    structured_entry[module_name] = module_entry
+            
+            # Only add entries that have at least one module
+            if any(key in structured_entry for key in ["pdf", "video", "github", "company_website", "agentic_research"]):
+                structured_history.append(structured_entry)
+        
+        return {
+            "message": f"Retrieved {len(structured_history)} pitch analysis records",
+            "data": structured_history
+        }
+        
+    except Exception as e:
+        return {
+            "message": f"Error reading pitch history: {str(e)}",
+            "data": []
+        }
+
+
+@app.post("/analyze-pitch/")
+async def analyze_pitch(
+    pdf_document: Union[UploadFile, str, None] = File(None, description="Optional PDF pitch deck."),
+    video_file: Union[UploadFile, str, None] = File(None, description="Optional video of the pitch or demo."),
+    source_url: Optional[str] = Form(None, description="Optional URL (e.g., GitHub repo)."),
+    company_url: Optional[str] = Form(None, description="Optional company website URL.")
+):
+    """
+    Asynchronously receives all pitch assets, runs processing in parallel,
+    and returns a confirmation upon completion.
+    """
+    # --- Type coercion for optional file uploads ---
+    # When a file is not provided, the form sends an empty string `''`
+    # We convert it to `None` to handle it cleanly in our logic.
+    final_pdf_document: Optional[UploadFile] = pdf_document if hasattr(pdf_document, 'filename') else None
+    final_video_file: Optional[UploadFile] = video_file if hasattr(video_file, 'filename') else None
+    
+    # Which modules have input, decided once
+    has_video = final_video_file is not None and (getattr(final_video_file, 'size', None) or 0) > 0
+    has_pdf = final_pdf_document is not None and bool(final_pdf_document.filename)
+    has_source_url = bool(source_url)
+    has_company_url = bool(company_url)
+    
+    # Nothing to analyze; reject before doing any work
+    if not (has_video or has_pdf or has_source_url or has_company_url):
+        raise HTTPException(
+            status_code=400,
+            detail="At least one of pdf_document, video_file, source_url, or company_url is required"
+        )
+    
+    logger.info("🚀 Received new pitch analysis request.")
+    logger.info("PDF document: %s", getattr(pdf_document, 'filename', 'None'))
+    logger.info("Video file: %s", getattr(video_file, 'filename', 'None'))
+    logger.info("Source URL: %s", source_url or 'None')
+    logger.info("Company URL: %s", company_url or 'None')
+    
+    # Additional debugging for video file - using direct attribute access
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("DEBUG: Type of video_file received: %s", type(video_file))
+        if hasattr(video_file, 'filename'):
+            logger.debug("DEBUG: video_file.filename = '%s'", video_file.filename)
+        if hasattr(video_file, 'content_type'):
+            logger.debug("DEBUG: video_file.content_type = '%s'", video_file.content_type)
+        if hasattr(video_file, 'size'):
+            logger.debug("DEBUG: video_file.size = %s", video_file.size)
+        else:
+            logger.debug("DEBUG: video_file has no 'size' attribute")
+
+    # --- TRUE PARALLEL EXECUTION ---
+    # All tasks run in parallel - PDF, video, GitHub URL, and company URL are completely independent
+    logger.info("🚀 Starting parallel processing for ALL tasks...")
+    
+    # One spec per module that has input, in a fixed order; every step below
+    # pairs these with parallel_results instead of re-checking the inputs
+    module_specs = []
+    
+    # Add video processing task if a video is provided
+    if has_video:
+        logger.info("Adding video processing task for file with size: %s bytes", final_video_file.size)
+        module_specs.append({
+            "key": "video_analysis",
+            "module_name": "Video Processor",
+            "inputs": {"input_file": final_video_file.filename},
+            "heading": "VIDEO ANALYSIS",
+            "label": "Video Analysis",
+            "processing": _run_heavy_processor(process_video, final_video_file)
+        })
+    else:
+        logger.info("Skipping video processing - no valid video file (size: %s)", getattr(final_video_file, 'size', 'N/A'))
+        
+    # Add PDF processing task if a PDF is provided
+    if has_pdf:
+        logger.info("Adding PDF processing task...")
+        module_specs.append({
+            "key": "pdf_analysis",
+            "module_name": "PDF Processor",
+            "inputs": {"input_file": final_pdf_document.filename},
+            "heading": "PDF DOCUMENT ANALYSIS",
+            "label": "PDF Analysis",
+            "processing": _run_heavy_processor(process_pdf, final_pdf_document)
+        })
+        
+    # Add GitHub URL processing task if a URL is provided
+    if has_source_url:
+        logger.info("Adding GitHub URL processing task...")
+        module_specs.append({
+            "key": "github_analysis",
+            "module_name": "GitHub Repository Analyzer",
+            "inputs": {"input_url": source_url},
+            "heading": "GITHUB REPOSITORY ANALYSIS",
+            "label": "GitHub Analysis",
+            "processing": process_url(source_url)
+        })
+        
+    # Add company URL processing task if a company URL is provided
+    if has_company_url:
+        logger.info("Adding company URL processing task...")
+        module_specs.append({
+            "key": "company_analysis",
+            "module_name": "Company Website Analyzer",
+            "inputs": {"input_url": company_url},
+            "heading": "COMPANY WEBSITE ANALYSIS",
+            "label": "Company Analysis",
+            "processing": process_company_url(company_url)
+        })
+        
+    # Run all tasks concurrently and wait for them to complete (there is at least one)
+    logger.info("🔥 Executing %d tasks in TRUE PARALLEL...", len(module_specs))
+    parallel_results = [None] * len(module_specs)
+    module_reviews = [None] * len(module_specs)
+    # The task group cancels and awaits every module if the request is abandoned;
+    # _run_module turns a module failure into its result, so siblings keep running.
+    # Each module is summarized and scored as soon as it finishes, while slower
+    # modules (usually the video) are still processing, and the agentic search
+    # starts the moment the last module result is in
+    async with asyncio.TaskGroup() as task_group:
+        module_tasks = [
+            task_group.create_task(_run_module(index, spec["processing"], parallel_results))
+            for index, spec in enumerate(module_specs)
+        ]
+        for index, (spec, module_task) in enumerate(zip(module_specs, module_tasks)):
+            task_group.create_task(
+                _review_module(module_task, index, spec["label"], parallel_results, module_reviews)
+            )
+        research_task = task_group.create_task(
+            _research_modules(module_tasks, module_specs, parallel_results)
+        )
+    logger.info("✅ All parallel processing tasks completed.")
+    
+    # --- Print Final Results to Console ---
+    # Results can be multi-MB transcripts, so they are only dumped with PITCHBOT_DEBUG
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("\n%s\n🎉 FINAL PROCESSING RESULTS 🎉\n%s", "="*80, "="*80)
+        for i, result in enumerate(parallel_results):
+            logger.debug("\n%s\n📄 RESULT %d\n%s\n%s", "-"*80, i + 1, "-"*80, result)
+        logger.debug("="*80)
+
+    # Create structured response with module identification
+    structured_results = {
+        "processing_summary": {
+            "total_modules": len(module_specs),
+            "successful_completions": sum(
+                not isinstance(result, Exception) for result in parallel_results
+            ),
+            "processing_time": "Completed in parallel"
+        },
+        "modules": {}
+    }
+    
+    # Map results to their respective modules
+    module_entries = []
+    for spec, result in zip(module_specs, parallel_results):
+        if isinstance(result, Exception):
+            module_entry = {
+                "module_name": spec["module_name"],
+                **spec["inputs"],
+                "status": "failed",
+                "error": str(result),
+                "result": None
+            }
+        else:
+            module_entry = {
+                "module_name": spec["module_name"],
+                **spec["inputs"],
+                "status": "completed",
+                "result": result
+            }
+            
+            # Extract domain from company analysis result
+            if spec["key"] == "company_analysis":
+                module_entry["domain"] = extract_domain_from_company_analysis(result)
+        
+        structured_results["modules"][spec["key"]] = module_entry
+        module_entries.append(module_entry)
+    
+    # Attach the LLAMA summaries and rubric scores gathered as each module finished
+    # (failed modules were not reviewed)
+    for module_entry, module_review in zip(module_entries, module_reviews):
+        if module_review is None:
+            continue
+        module_summary, rubric_scores = module_review
+        if module_summary:
+            module_entry["llama_summary"] = module_summary
+        module_entry["rubric_scores"] = rubric_scores
+    
+    # Collect the agentic search results started above
+    agentic_search_result = research_task.result()
+    
+    # Print agentic search results
+    if agentic_search_result and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("\n%s\n🔍 AGENTIC MARKET RESEARCH RESULTS\n%s", "-"*80, "-"*80)
+        if "analysis" in agentic_search_result and agentic_search_result["analysis"]:
+            logger.debug("%s", agentic_search_result["analysis"])
+        else:
+            logger.debug("Market research data collected but analysis not available.")
+            logger.debug("Search queries executed: %d", len(agentic_search_result.get('search_queries', [])))
+            logger.debug("Total pages analyzed: %s", agentic_search_result.get('total_pages_analyzed', 0))
+        logger.debug("="*80)
+    
+    # Add agentic search results to structured response
+    if agentic_search_result:
+        market_research_analysis = agentic_search_result.get("analysis", "")
+        structured_results["modules"]["market_research"] = {
+            "module_name": "Agentic Market Research",
+            "input_summary": "Combined analysis from all processed modules",
+            "status": "completed" if "error" not in agentic_search_result else "failed",
+            "search_queries": agentic_search_result.get("search_queries", []),
+            "total_pages_analyzed": agentic_search_result.get("total_pages_analyzed", 0),
+            "analysis": market_research_analysis,
+            "error": agentic_search_result.get("error", None)
+        }
+        
+        # Add LLAMA summarization and rubric scoring for market research, concurrently
+        # (only if successfully completed)
+        if "error" not in agentic_search_result and market_research_analysis:
+            market_research_summary, market_research_rubric_scores = await asyncio.gather(
+                add_module_summary("Market Research", market_research_analysis),
+                add_rubric_scores(market_research_analysis, "Market Research")
+            )
+            if market_research_summary:
+                structured_results["modules"]["market_research"]["llama_summary"] = market_research_summary
+            structured_results["modules"]["market_research"]["rubric_scores"] = market_research_rubric_scores
+
+    # Create the final response
+    final_response = {
+        "message": "Pitch assets received and processed successfully.",
+        "analysis": structured_results
+    }
+    
+    # --- SAVE TO JSON FILE ---
+    logger.info("\n💾 Saving analysis to JSON file...")
+    save_analysis_to_json(final_response)
+    
+    return final_response
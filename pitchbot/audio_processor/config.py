@@ -13,7 +13,15 @@ class AudioProcessingConfig:
     
     # Whisper Configuration
     whisper_model: str = "base"
+    whisper_device: str = "auto"
+    whisper_compute_type: str = "auto"  # CTranslate2 compute type; "auto" is bfloat16/float16 on CUDA, int8 on CPU
+    whisper_beam_size: int = 5
+    whisper_flash_attention: bool = False  # Fused attention kernel on CUDA (Ampere or newer)
+    quantize_cpu: bool = True  # Use int8 weights on CPU when compute type is "auto"
     language: str = "en"
+    transcription_workers: int = 1  # Shards transcribed in parallel by the Whisper model
+    shard_seconds: int = 60  # Target shard length; cuts are moved to the nearest silence
+    whisper_batch_size: int = 0  # >0 decodes each shard's 30s chunks in batches of this size (GPU; raise shard_seconds to fill batches)
 
     # OpenAI Configuration
     openai_api_key: Optional[str] = None
@@ -25,6 +33,9 @@ class AudioProcessingConfig:
     llama_model: str = "Llama-4-Maverick-17B-128E-Instruct-FP8"
     llama_base_url: str = "https://api.llama-api.com/v1"
     
+    # Cache Configuration
+    summary_cache_dir: str = os.path.join(os.path.expanduser("~"), ".pitchbot", "llama_cache")
+    
     # Processing Configuration
     max_file_size_mb: int = 100
     supported_formats: tuple = (".opus", ".mp3", ".wav", ".m4a", ".flac", ".ogg")
@@ -3,8 +3,11 @@ Main audio processing pipeline that orchestrates transcription and summarization
 """
 
 import asyncio
+import hashlib
+import math
+from collections import Counter, OrderedDict
 from typing import Optional, Dict, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
 from fastapi import UploadFile
 
@@ -12,6 +15,12 @@ from .config import AudioProcessingConfig, default_config
 from .transcriber import AudioTranscriber
 from .summarizer import TextSummarizer
 
+# Number of recent results kept for duplicate-pitch detection
+DEDUPE_CAPACITY = 64
+
+# Transcripts at least this similar (bag-of-words cosine) count as the same pitch
+DEDUPE_SIMILARITY = 0.95
+
 
 @dataclass
 class ProcessingResult:
@@ -32,6 +41,49 @@ class AudioProcessor:
         self.config = config or default_config
         self.transcriber = AudioTranscriber(self.config)
         self.summarizer = TextSummarizer(self.config)
+        # Recent results keyed by transcript hash, with their term vectors for fuzzy matching
+        self._recent_results: OrderedDict = OrderedDict()
+    
+    @staticmethod
+    def _transcript_key(transcribed_text: str, custom_prompt: Optional[str]) -> str:
+        """Hash a case/whitespace-normalized transcript together with its prompt."""
+        normalized = " ".join(transcribed_text.lower().split())
+        return hashlib.sha256(f"{custom_prompt or ''}\0{normalized}".encode("utf-8")).hexdigest()
+    
+    def _find_duplicate(
+        self,
+        key: str,
+        terms: Counter,
+        custom_prompt: Optional[str]
+    ) -> Optional[ProcessingResult]:
+        """Return a recent result for the same (or a near-identical) transcript, if any."""
+        if key in self._recent_results:
+            self._recent_results.move_to_end(key)
+            return self._recent_results[key][2]
+        
+        norm = math.sqrt(sum(count * count for count in terms.values()))
+        if not norm:
+            return None
+        for prompt, past_terms, result in self._recent_results.values():
+            if prompt != custom_prompt:
+                continue
+            dot = sum(count * past_terms[term] for term, count in terms.items())
+            past_norm = math.sqrt(sum(count * count for count in past_terms.values()))
+            if past_norm and dot / (norm * past_norm) >= DEDUPE_SIMILARITY:
+                return result
+        return None
+    
+    def _remember_result(
+        self,
+        key: str,
+        terms: Counter,
+        custom_prompt: Optional[str],
+        result: ProcessingResult
+    ):
+        """Keep a result for duplicate detection, evicting the oldest past capacity."""
+        self._recent_results[key] = (custom_prompt, terms, result)
+        if len(self._recent_results) > DEDUPE_CAPACITY:
+            self._recent_results.popitem(last=False)
     
     async def process_audio(
         self, 
@@ -55,46 +107,89 @@ class AudioProcessor:
             
             # Step 1: Transcribe audio to text
             print("📝 Transcribing audio...")
-            transcribed_text = await self.transcriber.transcribe(audio_file)
+            parts = []
+            no_speech_probs = []
+            async for text, shard_no_speech_probs in self.transcriber.transcribe_shards(audio_file):
+                parts.append(text)
+                no_speech_probs.extend(shard_no_speech_probs)
+                print(f"   ... transcribed shard {len(parts)} ({len(text)} characters)")
+            # Collapse whitespace runs inside and between shards
+            transcribed_text = " ".join(" ".join(parts).split())
+            if not transcribed_text:
+                raise ValueError("Transcription resulted in empty text")
+            # Averaged so one quiet but real sentence does not mark the whole pitch as noise
+            no_speech_prob = sum(no_speech_probs) / len(no_speech_probs) if no_speech_probs else None
             #print(transcribed_text)
             print(f"✅ Transcription complete ({len(transcribed_text)} characters)")
             
+            # Re-uploads of the same pitch reuse the earlier summary
+            key = self._transcript_key(transcribed_text, custom_prompt)
+            terms = Counter(transcribed_text.lower().split())
+            duplicate = self._find_duplicate(key, terms, custom_prompt)
+            if duplicate is not None:
+                print("♻️  Matched a previously processed pitch, skipping summarization")
+                return replace(
+                    duplicate,
+                    file_path=audio_file.filename,
+                    transcribed_text=transcribed_text,
+                    processing_time_seconds=(datetime.now() - start_time).total_seconds(),
+                    timestamp=start_time,
+                    metadata={
+                        **duplicate.metadata,
+                        "file_size_mb": audio_file.size / (1024 * 1024) if audio_file.size else 0.0,
+                        "transcription_length": len(transcribed_text),
+                        "no_speech_prob": no_speech_prob,
+                        "cache_hit": True
+                    }
+                )
+            
             # Step 2: Update prompt if custom one provided
             if custom_prompt:
                 self.summarizer.update_prompt_template(custom_prompt)
             
             # Step 3: Summarize transcribed text
             print("🤖 Generating summary...")
-            summary = await self.summarizer.summarize(transcribed_text)
+            summary = await self.summarizer.summarize(transcribed_text, no_speech_prob)
             print("✅ Summary complete")
             
-            # Calculate processing time
-            end_time = datetime.now()
-            processing_time = (end_time - start_time).total_seconds()
-            
-            # Create result
-            result = ProcessingResult(
-                file_path=audio_file.filename,
-                transcribed_text=transcribed_text,
-                summary=summary,
-                processing_time_seconds=processing_time,
-                timestamp=start_time,
-                metadata={
-                    "openai_model": self.config.openai_model,
-                    "llama_model": self.config.llama_model,
-                    "file_size_mb": audio_file.size / (1024 * 1024) if audio_file.size else 0.0,
-                    "transcription_length": len(transcribed_text),
-                    "summary_length": len(summary)
-                }
-            )
+            result = self._build_result(audio_file, transcribed_text, summary, start_time, no_speech_prob)
+            self._remember_result(key, terms, custom_prompt, result)
             
-            print(f"🎉 Async processing complete in {processing_time:.1f} seconds")
+            print(f"🎉 Async processing complete in {result.processing_time_seconds:.1f} seconds")
             return result
             
         except Exception as e:
             print(f"❌ Processing failed: {str(e)}")
             raise
     
+    def _build_result(
+        self,
+        audio_file: UploadFile,
+        transcribed_text: str,
+        summary: str,
+        start_time: datetime,
+        no_speech_prob: Optional[float] = None
+    ) -> ProcessingResult:
+        """Assemble the ProcessingResult for a processed file."""
+        processing_time = (datetime.now() - start_time).total_seconds()
+        
+        return ProcessingResult(
+            file_path=audio_file.filename,
+            transcribed_text=transcribed_text,
+            summary=summary,
+            processing_time_seconds=processing_time,
+            timestamp=start_time,
+            metadata={
+                "openai_model": self.config.openai_model,
+                "llama_model": self.config.llama_model,
+                "file_size_mb": audio_file.size / (1024 * 1024) if audio_file.size else 0.0,
+                "transcription_length": len(transcribed_text),
+                "summary_length": len(summary),
+                "no_speech_prob": no_speech_prob,
+                "cache_hit": False
+            }
+        )
+    
     def print_result(self, result: ProcessingResult):
         """Print a formatted result."""
         print("\n" + "="*80)
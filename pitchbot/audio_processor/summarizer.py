@@ -3,59 +3,109 @@ Text summarization using Llama-4-Maverick-17B-128E-Instruct-FP8 model.
 """
 
 import asyncio
-from typing import Optional
+import hashlib
+from typing import Dict, Optional, Tuple
 
+import diskcache
 import httpx
 from llama_api_client import AsyncLlamaAPIClient
 
 from .config import AudioProcessingConfig, default_config
 
 
+# Static instructions for pitch summarization, sent as the system message
+SUMMARY_SYSTEM_PROMPT = """You are an expert analyst specializing in summarizing startup and project pitch presentations. The user message is a transcribed recording of a live pitch session.
+
+Your task is to generate a structured summary that strictly reflects what was actually said—without making any assumptions or adding external knowledge. Do not hallucinate or infer intent unless it is clearly stated.
+
+Please extract and organize the summary under the following headings:
+- **Idea Summary**: What is the core idea or product being pitched?
+- **Problem Being Solved**: What pain point or market gap is the speaker addressing?
+- **Proposed Solution**: How does the idea solve the problem?
+- **Target Users / Market**: Who is this idea for?
+- **Differentiation**: What makes this idea unique or better than existing alternatives?
+- **Current Progress**: Any mention of prototypes, demos, or current status
+- **Next Steps / Ask**: Any specific requests, action items, or future plans mentioned
+
+Only use the information provided in the transcript. If a section cannot be confidently filled, state "Not mentioned."
+If any clearly stated, relevant information from the transcript does not fit neatly into the sections above, include it at the end under a heading called **Additional Noteworthy Points**. Otherwise, omit it.
+"""
+
+
+# Transcripts shorter than this are not worth a Llama call
+MIN_SUMMARY_WORDS = 30
+
+# Returned instead of a summary for transcripts below MIN_SUMMARY_WORDS
+TOO_SHORT_SUMMARY = "Transcript too short to summarize."
+
+# Transcripts whose segments average a Whisper no_speech_prob above this are treated as silence/noise
+NO_SPEECH_THRESHOLD = 0.8
+
+# Returned instead of a summary for transcripts above NO_SPEECH_THRESHOLD
+NO_SPEECH_SUMMARY = "Recording appears to be silence or noise; not summarized."
+
+# Llama clients and summary caches shared by every summarizer
+_SHARED_LLAMA_CLIENTS: Dict[Tuple[str, str], AsyncLlamaAPIClient] = {}
+_SHARED_SUMMARY_CACHES: Dict[str, diskcache.Cache] = {}
+
+
+def get_llama_client(config: AudioProcessingConfig) -> AsyncLlamaAPIClient:
+    """Get or create the shared Llama client, validating the configuration once."""
+    key = (config.llama_api_key, config.llama_base_url)
+    if key not in _SHARED_LLAMA_CLIENTS:
+        config.validate()
+        _SHARED_LLAMA_CLIENTS[key] = AsyncLlamaAPIClient(
+            api_key=config.llama_api_key,
+            base_url=config.llama_base_url
+        )
+    return _SHARED_LLAMA_CLIENTS[key]
+
+
+def get_summary_cache(directory: str) -> diskcache.Cache:
+    """Get or open the shared summary cache for a directory."""
+    if directory not in _SHARED_SUMMARY_CACHES:
+        _SHARED_SUMMARY_CACHES[directory] = diskcache.Cache(directory)
+    return _SHARED_SUMMARY_CACHES[directory]
+
+
 class TextSummarizer:
     """Handles text summarization using Llama model."""
     
     def __init__(self, config: Optional[AudioProcessingConfig] = None):
         """Initialize the summarizer with configuration."""
         self.config = config or default_config
-        self.config.validate()
         
-        self.client = AsyncLlamaAPIClient(
-            api_key=self.config.llama_api_key,
-            base_url=self.config.llama_base_url
-        )
+        self.client = get_llama_client(self.config)
+        self.cache = get_summary_cache(self.config.summary_cache_dir)
+        self._system_prompt: Optional[str] = SUMMARY_SYSTEM_PROMPT
     
     def _create_summary_prompt(self, transcribed_text: str) -> str:
         """
-        Create a focused and grounded prompt for summarizing a live pitch presentation.
+        Create the per-request part of the pitch summary prompt.
+        
+        The static instructions live in SUMMARY_SYSTEM_PROMPT and are sent as a
+        separate system message, so the provider can reuse its cached prefix.
         """
-        prompt = f"""You are an expert analyst specializing in summarizing startup and project pitch presentations. The following is a transcribed recording of a live pitch session.
-
-    Your task is to generate a structured summary that strictly reflects what was actually said—without making any assumptions or adding external knowledge. Do not hallucinate or infer intent unless it is clearly stated.
-
-    Please extract and organize the summary under the following headings:
-    - **Idea Summary**: What is the core idea or product being pitched?
-    - **Problem Being Solved**: What pain point or market gap is the speaker addressing?
-    - **Proposed Solution**: How does the idea solve the problem?
-    - **Target Users / Market**: Who is this idea for?
-    - **Differentiation**: What makes this idea unique or better than existing alternatives?
-    - **Current Progress**: Any mention of prototypes, demos, or current status
-    - **Next Steps / Ask**: Any specific requests, action items, or future plans mentioned
-
-    Only use the information provided in the transcript. If a section cannot be confidently filled, state "Not mentioned."
-    If any clearly stated, relevant information from the transcript does not fit neatly into the sections above, include it at the end under a heading called **Additional Noteworthy Points**. Otherwise, omit it.
-
-    Transcribed pitch:
-    \"\"\"{transcribed_text}\"\"\"
-    """
-        return prompt
+        return f"""Transcribed pitch:
+\"\"\"{transcribed_text}\"\"\"
+"""
 
+    def _create_messages(self, prompt: str) -> list:
+        """Build the chat messages for a rendered prompt."""
+        if self._system_prompt is None:
+            return [{"role": "user", "content": prompt}]
+        return [
+            {"role": "system", "content": self._system_prompt},
+            {"role": "user", "content": prompt}
+        ]
     
-    async def summarize(self, text: str) -> str:
+    async def summarize(self, text: str, no_speech_prob: Optional[float] = None) -> str:
         """
         Summarize the given text using Llama model.
         
         Args:
             text: Text to summarize (usually transcribed audio)
+            no_speech_prob: Mean Whisper no_speech_prob of the transcript's segments, if known
             
         Returns:
             Summary of the text
@@ -63,19 +113,35 @@ class TextSummarizer:
         if not text.strip():
             raise ValueError("Input text is empty")
         
+        # Accidental recordings and silence produce a handful of words at most
+        if len(text.split()) < MIN_SUMMARY_WORDS:
+            return TOO_SHORT_SUMMARY
+        
+        # Whisper still transcribes something from noise, but flags it as unlikely speech
+        if no_speech_prob is not None and no_speech_prob > NO_SPEECH_THRESHOLD:
+            return NO_SPEECH_SUMMARY
+        
         prompt = self._create_summary_prompt(text)
+        messages = self._create_messages(prompt)
+        
+        # Identical prompts against the same model are served from disk
+        cache_key = hashlib.sha256(
+            (self.config.llama_model + (self._system_prompt or "") + prompt).encode("utf-8")
+        ).hexdigest()
+        cached_summary = self.cache.get(cache_key)
+        if cached_summary is not None:
+            return cached_summary
         
         try:
             response = await self.client.chat.completions.create(
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
+                messages=messages,
                 model=self.config.llama_model
             )
             
             # Extract the text from the response structure
             # Based on the actual response: response.completion_message.content.text
             summary = response.completion_message.content.text.strip()
+            self.cache.set(cache_key, summary)
             return summary
             
         except Exception as e:
@@ -91,4 +157,6 @@ class TextSummarizer:
         def _custom_prompt(transcribed_text: str) -> str:
             return custom_prompt_template.format(transcribed_text=transcribed_text)
         
-        self._create_summary_prompt = _custom_prompt 
\ No newline at end of file
+        # A custom template carries its own instructions
+        self._system_prompt = None
+        self._create_summary_prompt = _custom_prompt
@@ -3,14 +3,17 @@ Audio transcription using OpenAI's gpt-4o-transcribe model.
 """
 
 import os
+import stat
 import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
-import aiofiles
 from openai import AsyncOpenAI
-import whisper
-import torch
+import ctranslate2
+from faster_whisper import BatchedInferencePipeline, WhisperModel
+from faster_whisper.audio import decode_audio
 import io
 from pydub import AudioSegment
 import numpy as np
@@ -18,6 +21,50 @@ from fastapi import UploadFile
 
 from .config import AudioProcessingConfig, default_config
 
+# Whisper operates on 16kHz mono audio
+SAMPLE_RATE = 16000
+
+# NumPy dtypes for pydub's signed PCM sample widths (in bytes)
+PCM_DTYPES = {1: np.int8, 2: np.int16, 4: np.int32}
+
+# How far (in seconds) a shard boundary may move to land on silence
+SILENCE_SEARCH_SECONDS = 5
+
+# Frame length (in seconds) used when looking for the quietest cut point
+SILENCE_FRAME_SECONDS = 0.1
+
+@functools.lru_cache(maxsize=4)
+def load_whisper_model(
+    model_name: str,
+    device: str = "auto",
+    compute_type: str = "int8",
+    num_workers: int = 1,
+    flash_attention: bool = False
+) -> WhisperModel:
+    """Load a faster-whisper model once per process and share it across callers."""
+    return WhisperModel(
+        model_name,
+        device=device,
+        compute_type=compute_type,
+        num_workers=num_workers,
+        flash_attention=flash_attention
+    )
+
+
+# OpenAI clients shared by every transcriber, keyed by (api_key, base_url)
+_SHARED_OPENAI_CLIENTS: Dict[Tuple[Optional[str], Optional[str]], AsyncOpenAI] = {}
+
+
+def get_openai_client(config: AudioProcessingConfig) -> AsyncOpenAI:
+    """Get or create the shared OpenAI client for a configuration."""
+    key = (config.openai_api_key, config.openai_base_url)
+    if key not in _SHARED_OPENAI_CLIENTS:
+        _SHARED_OPENAI_CLIENTS[key] = AsyncOpenAI(
+            api_key=config.openai_api_key,
+            base_url=config.openai_base_url
+        )
+    return _SHARED_OPENAI_CLIENTS[key]
+
 
 class AudioTranscriber:
     """Handles audio transcription using local Whisper models."""
@@ -31,20 +78,79 @@ class AudioTranscriber:
         
         try:
             print(f"Loading Whisper model: {self.model_name}...")
-            self.model = whisper.load_model(self.model_name)
-            self.fp16 = torch.cuda.is_available()
+            self._load_model(self.model_name)
             print(f"✅ Whisper model '{self.model_name}' loaded successfully.")
         except Exception as e:
             raise RuntimeError(f"Failed to load Whisper model '{self.model_name}': {str(e)}")
+    
+    @property
+    def client(self) -> AsyncOpenAI:
+        """OpenAI client used by transcribe_file, created on first use."""
+        return get_openai_client(self.config)
+    
+    def _use_cuda(self) -> bool:
+        """Whether the configured device resolves to CUDA."""
+        return self.config.whisper_device == "cuda" or (
+            self.config.whisper_device == "auto" and ctranslate2.get_cuda_device_count() > 0
+        )
+    
+    def _resolve_compute_type(self, compute_type: str) -> str:
+        """
+        Map "auto" to bfloat16 kernels on CUDA (float16 on GPUs older than
+        Ampere) and, on CPU, to int8 weights (or float32 when
+        config.quantize_cpu is off).
+        """
+        if compute_type != "auto":
+            return compute_type
+        
+        if self._use_cuda():
+            # bfloat16 keeps float32's exponent range, so long-audio attention cannot overflow
+            if "bfloat16" in ctranslate2.get_supported_compute_types("cuda"):
+                return "bfloat16"
+            return "float16"
+        return "int8" if self.config.quantize_cpu else "float32"
+    
+    def _load_model(self, model_name: str, compute_type: Optional[str] = None):
+        """
+        Load the faster-whisper (CTranslate2) model and its worker threads.
+        
+        CTranslate2 runs up to num_workers transcriptions in parallel when they are
+        issued from separate threads, so one model serves every worker.
+        """
+        workers = max(1, self.config.transcription_workers)
+        self.compute_type = self._resolve_compute_type(compute_type or self.config.whisper_compute_type)
+        self.model = load_whisper_model(
+            model_name,
+            self.config.whisper_device,
+            self.compute_type,
+            workers,
+            # CTranslate2's fused flash-attention kernel is CUDA-only
+            self.config.whisper_flash_attention and self._use_cuda()
+        )
+        # The batched pipeline runs VAD, then pushes up to whisper_batch_size
+        # 30-second chunks through the encoder/decoder in a single pass
+        self._batched_model = (
+            BatchedInferencePipeline(model=self.model)
+            if self.config.whisper_batch_size > 0 else None
+        )
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="whisper")
+        
+    def _validate_audio_file(self, file_path: str) -> Tuple[Path, os.stat_result]:
+        """
+        Validate that the audio file exists and has supported format.
         
-    def _validate_audio_file(self, file_path: str) -> Path:
-        """Validate that the audio file exists and has supported format."""
+        Returns:
+            The path and its stat result, so callers can reuse the size without another stat
+        """
         path = Path(file_path)
         
-        if not path.exists():
+        # One stat call answers existence, file type and size
+        try:
+            stat_result = path.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(f"Audio file not found: {file_path}")
         
-        if not path.is_file():
+        if not stat.S_ISREG(stat_result.st_mode):
             raise ValueError(f"Path is not a file: {file_path}")
         
         if path.suffix.lower() not in self.config.supported_formats:
@@ -54,68 +160,190 @@ class AudioTranscriber:
             )
         
         # Check file size
-        file_size_mb = path.stat().st_size / (1024 * 1024)
+        file_size_mb = stat_result.st_size / (1024 * 1024)
         if file_size_mb > self.config.max_file_size_mb:
             raise ValueError(
                 f"File too large: {file_size_mb:.1f}MB. "
                 f"Maximum size: {self.config.max_file_size_mb}MB"
             )
         
-        return path
+        return path, stat_result
     
-    async def transcribe(self, audio_file: UploadFile) -> str:
+    def _decode_audio(self, audio_data: bytes) -> np.ndarray:
+        """Decode audio bytes into the 16kHz mono float32 samples Whisper expects."""
+        try:
+            # PyAV decodes, downmixes and resamples in libav and hands back float32
+            # directly, skipping pydub's Python resampler and extra array copies
+            return decode_audio(io.BytesIO(audio_data), sampling_rate=SAMPLE_RATE)
+        except Exception:
+            # Fall back to pydub/ffmpeg for anything PyAV cannot open
+            return self._decode_audio_pydub(audio_data)
+    
+    def _decode_audio_pydub(self, audio_data: bytes) -> np.ndarray:
+        """Decode audio bytes with pydub (ffmpeg subprocess) as a fallback."""
+        # Use pydub to load audio from bytes and process it
+        sound = AudioSegment.from_file(io.BytesIO(audio_data))
+        
+        # Resample to 16kHz, which is required by Whisper
+        # (many browser recordings already are, so skip the copy when possible)
+        if sound.frame_rate != SAMPLE_RATE:
+            sound = sound.set_frame_rate(SAMPLE_RATE)
+        # Ensure it's single channel (mono)
+        if sound.channels != 1:
+            sound = sound.set_channels(1)
+        
+        # 24-bit samples have no NumPy dtype; widen them to 32-bit
+        if sound.sample_width not in PCM_DTYPES:
+            sound = sound.set_sample_width(4)
+        
+        # Pydub samples are signed integers, so we normalize to [-1, 1]
+        # View the raw PCM bytes in place and scale into float32 in a single pass
+        raw = np.frombuffer(sound.raw_data, dtype=PCM_DTYPES[sound.sample_width])
+        samples = np.empty(raw.shape[0], dtype=np.float32)
+        np.multiply(raw, 1.0 / 2**(sound.sample_width * 8 - 1), out=samples, casting="unsafe")
+        return samples
+    
+    def _split_on_silence(self, samples: np.ndarray) -> List[np.ndarray]:
         """
-        Transcribe audio file from in-memory data to text.
+        Split samples into roughly shard_seconds long shards.
+        
+        Each cut is moved to the quietest SILENCE_FRAME_SECONDS frame within
+        SILENCE_SEARCH_SECONDS of the nominal boundary so words are not split.
+        """
+        shard_length = self.config.shard_seconds * SAMPLE_RATE
+        if len(samples) <= shard_length:
+            return [samples]
+        
+        frame = int(SILENCE_FRAME_SECONDS * SAMPLE_RATE)
+        search = SILENCE_SEARCH_SECONDS * SAMPLE_RATE
+        
+        cuts = [0]
+        boundary = shard_length
+        while boundary < len(samples) - search:
+            window = samples[boundary - search:boundary + search]
+            frames = window[:len(window) // frame * frame].reshape(-1, frame)
+            quietest = int(np.argmin(np.square(frames).mean(axis=1)))
+            cuts.append(boundary - search + quietest * frame + frame // 2)
+            boundary = cuts[-1] + shard_length
+        cuts.append(len(samples))
+        
+        return [samples[start:end] for start, end in zip(cuts, cuts[1:])]
+    
+    def _transcribe_samples(self, samples: np.ndarray) -> Tuple[str, List[float]]:
+        """
+        Run Whisper on a block of samples (blocking).
+        
+        Returns:
+            The transcribed text and the no_speech_prob of each of its segments
+        """
+        # Segments are produced lazily, so decoding happens while joining them here
+        if self._batched_model is not None:
+            segments, _ = self._batched_model.transcribe(
+                samples,
+                language=self.language,
+                beam_size=self.config.whisper_beam_size,
+                batch_size=self.config.whisper_batch_size
+            )
+        else:
+            segments, _ = self.model.transcribe(
+                samples,
+                language=self.language,
+                vad_filter=True,
+                beam_size=self.config.whisper_beam_size
+            )
+        texts = []
+        no_speech_probs = []
+        for segment in segments:
+            texts.append(segment.text)
+            no_speech_probs.append(segment.no_speech_prob)
+        return "".join(texts).strip(), no_speech_probs
+    
+    async def transcribe_shards(self, audio_file: UploadFile) -> AsyncIterator[Tuple[str, List[float]]]:
+        """
+        Transcribe audio file from in-memory data, yielding shard by shard.
+        
+        The audio is split at silences into shards that are transcribed in parallel
+        (up to transcription_workers at a time); each shard is yielded in order as
+        soon as it and the shards before it are done.
         
         Args:
             audio_file: UploadFile object containing audio data.
             
-        Returns:
-            Transcribed text
+        Yields:
+            Each non-silent shard's text and the no_speech_prob of its segments, in order
         """
         if not audio_file:
             raise ValueError("Audio file is not provided")
         
+        loop = asyncio.get_running_loop()
+        pending = []
         try:
             # Read the audio data from the in-memory file
             audio_data = await audio_file.read()
+            samples = await asyncio.to_thread(self._decode_audio, audio_data)
             
-            # Use pydub to load audio from bytes and process it
-            sound = AudioSegment.from_file(io.BytesIO(audio_data))
-            
-            # Resample to 16kHz, which is required by Whisper
-            sound = sound.set_frame_rate(16000)
-            # Ensure it's single channel (mono)
-            sound = sound.set_channels(1)
-            
-            # Convert to a NumPy array of float32
-            # Pydub samples are signed integers, so we normalize to [-1, 1]
-            samples = np.array(sound.get_array_of_samples()).astype(np.float32) / (2**(sound.sample_width * 8 - 1))
-            
-            # Transcribe the audio data
-            result = self.model.transcribe(
-                samples, 
-                fp16=self.fp16,
-                language=self.language
-            )
-            
-            transcribed_text = result["text"].strip()
-            
-            if not transcribed_text:
-                raise ValueError("Transcription resulted in empty text")
-                
-            return transcribed_text
+            # Transcribe off the event loop so other requests keep running
+            pending = [
+                loop.run_in_executor(self._executor, self._transcribe_samples, shard)
+                for shard in self._split_on_silence(samples)
+            ]
+            for future in pending:
+                text, no_speech_probs = await future
+                if text:
+                    yield text, no_speech_probs
             
         except Exception as e:
             # Add filename to error for better debugging
             raise RuntimeError(f"Transcription for {audio_file.filename} failed: {str(e)}") from e
+        finally:
+            for future in pending:
+                future.cancel()
+    
+    async def transcribe_stream(self, audio_file: UploadFile) -> AsyncIterator[str]:
+        """
+        Transcribe audio file from in-memory data, yielding text shard by shard.
+        
+        Args:
+            audio_file: UploadFile object containing audio data.
             
-    def update_model(self, model_name: str):
-        """Update the model used for transcription."""
+        Yields:
+            Transcribed text of each non-silent shard, in order
+        """
+        async for text, _ in self.transcribe_shards(audio_file):
+            yield text
+    
+    async def transcribe(self, audio_file: UploadFile) -> str:
+        """
+        Transcribe audio file from in-memory data to text.
+        
+        Args:
+            audio_file: UploadFile object containing audio data.
+            
+        Returns:
+            Transcribed text
+        """
+        parts = [text async for text in self.transcribe_stream(audio_file)]
+        # Collapse whitespace runs inside and between shards
+        transcribed_text = " ".join(" ".join(parts).split())
+        
+        if not transcribed_text:
+            raise RuntimeError(f"Transcription for {audio_file.filename} failed: Transcription resulted in empty text")
+        
+        return transcribed_text
+            
+    def update_model(self, model_name: str, compute_type: Optional[str] = None):
+        """
+        Update the model used for transcription.
+        
+        Args:
+            model_name: Whisper model size or path
+            compute_type: CTranslate2 compute type (defaults to config.whisper_compute_type)
+        """
         try:
-            self.model = whisper.load_model(model_name)
-            self.fp16 = self.model.is_multilingual # Check if the new model is multilingual
-            print(f"✅ Whisper model updated to '{model_name}'.")
+            self._executor.shutdown(wait=True)
+            self._load_model(model_name, compute_type)
+            self.model_name = model_name
+            print(f"✅ Whisper model updated to '{model_name}' ({self.compute_type}).")
         except Exception as e:
             raise RuntimeError(f"Failed to load Whisper model '{model_name}': {str(e)}")
         
@@ -129,19 +357,20 @@ class AudioTranscriber:
         Returns:
             Transcribed text
         """
-        validated_path = self._validate_audio_file(file_path)
+        validated_path, _ = self._validate_audio_file(file_path)
         
         try:
-            # Read the audio file
-            async with aiofiles.open(validated_path, 'rb') as audio_file:
-                audio_data = await audio_file.read()
-            
-            # Call OpenAI transcription API
-            response = await self.client.audio.transcriptions.create(
-                model=self.config.openai_model,
-                file=(validated_path.name, audio_data),
-                response_format="text"
-            )
+            # Hand the SDK a file object so the multipart body is streamed from disk
+            # instead of holding the whole file in memory
+            with open(validated_path, 'rb') as audio_file:
+                if hasattr(os, "posix_fadvise"):
+                    # The upload reads the file front to back once
+                    os.posix_fadvise(audio_file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                response = await self.client.audio.transcriptions.create(
+                    model=self.config.openai_model,
+                    file=(validated_path.name, audio_file),
+                    response_format="text"
+                )
             
             return response
             
@@ -0,0 +1,53 @@
+"""
+File extension to language name mapping shared by the code analyzer modules.
+"""
+
+import functools
+from types import MappingProxyType
+
+# Lowercase file extension -> human-readable language name
+LANG_MAP = MappingProxyType({
+    '.py': 'Python',
+    '.js': 'JavaScript',
+    '.ts': 'TypeScript',
+    '.jsx': 'React JSX',
+    '.tsx': 'React TSX',
+    '.java': 'Java',
+    '.cpp': 'C++',
+    '.c': 'C',
+    '.h': 'C Header',
+    '.hpp': 'C++ Header',
+    '.cs': 'C#',
+    '.go': 'Go',
+    '.rs': 'Rust',
+    '.php': 'PHP',
+    '.rb': 'Ruby',
+    '.swift': 'Swift',
+    '.kt': 'Kotlin',
+    '.scala': 'Scala',
+    '.clj': 'Clojure',
+    '.hs': 'Haskell',
+    '.ml': 'OCaml',
+    '.fs': 'F#',
+    '.vb': 'Visual Basic',
+    '.pl': 'Perl',
+    '.sh': 'Shell',
+    '.bash': 'Bash',
+    '.zsh': 'Zsh',
+    '.fish': 'Fish',
+    '.ps1': 'PowerShell',
+    '.r': 'R',
+    '.sql': 'SQL',
+    '.html': 'HTML',
+    '.css': 'CSS',
+    '.scss': 'SCSS',
+    '.less': 'Less',
+    '.vue': 'Vue',
+    '.svelte': 'Svelte'
+})
+
+
+@functools.lru_cache(maxsize=128)
+def detect_language(extension: str) -> str:
+    """Detect programming language from file extension (a repo uses only a handful)."""
+    return LANG_MAP.get(extension.lower(), 'Unknown')
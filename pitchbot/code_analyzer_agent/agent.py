@@ -5,28 +5,115 @@ Main agent for analyzing GitHub repositories and providing comprehensive code an
 """
 
 import os
+import io
+import hashlib
 import json
+import re
+import tarfile
 import tempfile
 import shutil
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional, Set, Tuple
 import asyncio
-import aiohttp
+import aiofiles
+import diskcache
 from urllib.parse import urlparse
 
 from .file_utils import CodeFileFilter
 from .llama_client import LlamaClient
 
+# Optional incremental JSON parser for streamed analysis responses
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Optional Aho-Corasick automaton for matching all technology keywords in one pass
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Only this many bytes of each file are read and analyzed; longer files are truncated
+MAX_ANALYZED_FILE_BYTES = 16384
+
+# Technologies recognized in free-text analysis responses
+TECH_KEYWORDS = [
+    'python', 'javascript', 'typescript', 'react', 'vue', 'angular',
+    'node.js', 'express', 'fastapi', 'django', 'flask', 'spring',
+    'java', 'c++', 'c#', 'go', 'rust', 'php', 'ruby', 'rails',
+    'postgresql', 'mysql', 'mongodb', 'redis', 'docker', 'kubernetes'
+]
+
+if AHOCORASICK_AVAILABLE:
+    _TECH_AUTOMATON = ahocorasick.Automaton()
+    for _tech in TECH_KEYWORDS:
+        _TECH_AUTOMATON.add_word(_tech, _tech)
+    _TECH_AUTOMATON.make_automaton()
+
+# Sentences are the text between periods, as in the original str.split('.')
+_SENTENCE_RE = re.compile(r'[^.]+')
+
+# Indicator words are matched as substrings (so "issues" counts as "issue")
+_PITFALL_RE = re.compile(
+    r'issue|problem|pitfall|vulnerability|anti-pattern|tight coupling|missing|lacks|weakness',
+    re.IGNORECASE
+)
+_IMPROVEMENT_RE = re.compile(
+    r'recommend|improve|enhancement|should|could|better|optimize|refactor|implement',
+    re.IGNORECASE
+)
+
+# Uncached files are packed into shared requests up to this many characters
+BATCH_MAX_CHARS = 6000
+
+# Outermost JSON array in a batched analysis response
+_JSON_ARRAY_RE = re.compile(r'\[.*\]', re.DOTALL)
+
+# Hosts whose repositories can be fetched as tarballs from the GitHub API
+GITHUB_HOSTS = {"github.com", "www.github.com"}
+
+# Per-file analyses, keyed by a hash of the prompt sent for the file
+DEFAULT_CONTEXT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".pitchbot", "code_context_cache")
+
+# Context caches shared by every agent, keyed by directory
+_SHARED_CONTEXT_CACHES: Dict[str, diskcache.Cache] = {}
+
+
+def get_context_cache(directory: str) -> diskcache.Cache:
+    """Get or open the shared per-file context cache for a directory."""
+    if directory not in _SHARED_CONTEXT_CACHES:
+        _SHARED_CONTEXT_CACHES[directory] = diskcache.Cache(directory)
+    return _SHARED_CONTEXT_CACHES[directory]
+
+
+def close_context_caches():
+    """Close every shared context cache (call once when the application shuts down)."""
+    for cache in _SHARED_CONTEXT_CACHES.values():
+        cache.close()
+    _SHARED_CONTEXT_CACHES.clear()
+
 
 class CodeAnalyzerAgent:
     """Main agent for analyzing code repositories."""
     
-    def __init__(self, llama_api_key: Optional[str] = None, max_workers: int = 10):
+    def __init__(
+        self,
+        llama_api_key: Optional[str] = None,
+        max_workers: int = 10,
+        cache_dir: Optional[str] = None
+    ):
         """Initialize the code analyzer agent."""
         self.llama_client = LlamaClient(api_key=llama_api_key)
         self.file_filter = CodeFileFilter()
         self.max_workers = max_workers
         self.semaphore = asyncio.Semaphore(max_workers)
+        # Agents are built per request; the cache (an SQLite connection) is opened once
+        self.context_cache = get_context_cache(cache_dir or DEFAULT_CONTEXT_CACHE_DIR)
+        # Background checkout removals, referenced until they finish
+        self._cleanup_tasks: Set[asyncio.Task] = set()
         
     async def analyze_github_repository(self, github_url: str) -> Dict[str, Any]:
         """
@@ -42,8 +129,8 @@ class CodeAnalyzerAgent:
             # Clone repository to temporary directory
             repo_path = await self._clone_repository(github_url)
             
-            # Get all relevant code files
-            code_files = self.file_filter.get_code_files(repo_path)
+            # Stream relevant code files straight into the analysis step
+            code_files = self.file_filter.iter_code_files(repo_path)
             
             # Step 1: Analyze each file individually with simplified prompts
             file_contexts = await self._analyze_files_step1(code_files)
@@ -51,7 +138,7 @@ class CodeAnalyzerAgent:
             # ==> ROBUSTNESS FIX: Check if file analysis failed <==
             if not file_contexts:
                 await self.llama_client.close()
-                shutil.rmtree(repo_path)
+                self._schedule_cleanup(repo_path)
                 return {
                     "error": "Could not analyze any files in the repository. This is likely due to an API connection issue (SSL/network problem). Please try again.",
                     "summary": "Analysis failed. No files could be processed.",
@@ -62,17 +149,20 @@ class CodeAnalyzerAgent:
                     "improvements": []
                 }
             
+            # Both remaining steps send the same file listing, so build it once
+            context_string = self._build_context_string(file_contexts)
+            
             # Step 2: Generate exhaustive summary
-            exhaustive_summary = await self._generate_exhaustive_summary(file_contexts)
+            exhaustive_summary = await self._generate_exhaustive_summary(context_string)
             
             # Step 3: Generate detailed analysis
-            detailed_analysis = await self._generate_detailed_analysis(file_contexts)
+            detailed_analysis = await self._generate_detailed_analysis(context_string)
             
             # Clean up LLAMA client session
             await self.llama_client.close()
             
-            # Clean up temporary directory
-            shutil.rmtree(repo_path)
+            # Clean up temporary directory in the background
+            self._schedule_cleanup(repo_path)
             
             # Combine results
             result = detailed_analysis.copy()  # This contains stacks, pitfalls, improvements, etc.
@@ -95,103 +185,265 @@ class CodeAnalyzerAgent:
                 "improvements": []
             }
     
+    def _schedule_cleanup(self, repo_path: str):
+        """Remove a checkout (and its temporary parent) off the request path."""
+        temp_dir = os.path.dirname(repo_path)
+        task = asyncio.create_task(asyncio.to_thread(shutil.rmtree, temp_dir, ignore_errors=True))
+        self._cleanup_tasks.add(task)
+        task.add_done_callback(self._cleanup_tasks.discard)
+    
     async def _clone_repository(self, github_url: str) -> str:
-        """Clone GitHub repository to temporary directory."""
-        # Parse GitHub URL to get repository name
+        """
+        Fetch the GitHub repository's default branch into a temporary directory.
+        
+        For github.com URLs, downloads the HEAD tarball from the GitHub API
+        (no history, no git process) and falls back to a shallow clone if that
+        fails, e.g. when the API rate-limits. Other hosts are shallow-cloned.
+        """
+        # Parse GitHub URL to get owner and repository name
         parsed_url = urlparse(github_url)
-        repo_name = parsed_url.path.strip('/').split('/')[-1]
+        path_parts = parsed_url.path.strip('/').split('/')
+        repo_name = path_parts[-1]
         if repo_name.endswith('.git'):
             repo_name = repo_name[:-4]
+        # The tarball API only serves github.com; other hosts are cloned with git
+        is_github = parsed_url.netloc.lower() in GITHUB_HOSTS
+        owner = path_parts[0] if is_github and len(path_parts) >= 2 else None
         
         # Create temporary directory
         temp_dir = tempfile.mkdtemp()
         repo_path = os.path.join(temp_dir, repo_name)
         
-        # Clone repository
-        import subprocess
-        try:
-            subprocess.run(['git', 'clone', github_url, repo_path], 
-                         check=True, capture_output=True)
-        except subprocess.CalledProcessError as e:
-            raise Exception(f"Failed to clone repository: {e.stderr.decode()}")
+        if owner:
+            try:
+                await self._download_tarball(owner, repo_name, repo_path)
+                return repo_path
+            except Exception as e:
+                print(f"⚠️ Tarball download failed, falling back to git clone: {e}")
+                shutil.rmtree(repo_path, ignore_errors=True)
+        
+        # Shallow, blob-less clone of HEAD only
+        process = await asyncio.create_subprocess_exec(
+            'git', 'clone', '--depth=1', '--filter=blob:none', github_url, repo_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        _, stderr = await process.communicate()
+        if process.returncode != 0:
+            raise Exception(f"Failed to clone repository: {stderr.decode()}")
         
         return repo_path
     
-    async def _analyze_files_step1(self, code_files: List[str]) -> List[Dict[str, str]]:
+    async def _download_tarball(self, owner: str, repo_name: str, repo_path: str):
+        """Download the repository's HEAD tarball and unpack it at repo_path."""
+        tarball_url = f"https://api.github.com/repos/{owner}/{repo_name}/tarball"
+        # The pooled session keeps a warm connection to GitHub across analyses
+        session = LlamaClient.get_shared_session()
+        async with session.get(tarball_url) as response:
+            response.raise_for_status()
+            data = await response.read()
+        
+        await asyncio.to_thread(self._extract_tarball, data, repo_path)
+    
+    @staticmethod
+    def _extract_tarball(data: bytes, repo_path: str):
+        """Unpack a GitHub tarball, whose single top-level directory becomes repo_path."""
+        extract_dir = tempfile.mkdtemp(dir=os.path.dirname(repo_path))
+        try:
+            with tarfile.open(fileobj=io.BytesIO(data), mode='r:gz') as archive:
+                archive.extractall(extract_dir, filter='data')
+            
+            # GitHub wraps the tree in an "<owner>-<repo>-<sha>" directory
+            (top_level,) = os.listdir(extract_dir)
+            os.rename(os.path.join(extract_dir, top_level), repo_path)
+        finally:
+            shutil.rmtree(extract_dir, ignore_errors=True)
+    
+    async def _analyze_files_step1(self, code_files: Iterable[str]) -> List[Dict[str, str]]:
         """Step 1: Analyze each code file using simplified LLAMA API calls in parallel."""
-        print(f"🔄 Processing {len(code_files)} files with {self.max_workers} parallel workers...")
+        print(f"🔄 Processing files with {self.max_workers} parallel workers...")
         
-        # Create tasks for parallel processing
-        tasks = [self._analyze_single_file(file_path) for file_path in code_files]
+        # Files are read as the walk yields them. Cached files resolve immediately;
+        # small uncached files are packed into a shared request, and each group is
+        # sent as soon as it is full while the rest of the repository is still read
+        completed = []
+        tasks = []
+        batch, batch_chars = [], 0
+        file_count = 0
+        for index, file_path in enumerate(code_files):
+            file_count += 1
+            content = await self._read_code_file(file_path)
+            if content is None:
+                continue
+            
+            context = self.context_cache.get(self._context_cache_key(content))
+            if context is not None:
+                completed.append((index, {"fileName": file_path, "context": context, "code": content}))
+                continue
+            
+            if len(content) > BATCH_MAX_CHARS:
+                tasks.append(asyncio.create_task(self._analyze_group([(index, file_path, content)])))
+                continue
+            if batch and batch_chars + len(content) > BATCH_MAX_CHARS:
+                tasks.append(asyncio.create_task(self._analyze_group(batch)))
+                batch, batch_chars = [], 0
+            batch.append((index, file_path, content))
+            batch_chars += len(content)
+        if batch:
+            tasks.append(asyncio.create_task(self._analyze_group(batch)))
+        print(f"📂 Read {file_count} files, {len(completed)} from the analysis cache")
         
-        # Execute tasks in parallel with progress tracking
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Handle results as they finish instead of waiting for the slowest request
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                results = await next_done
+            except Exception as e:
+                print(f"❌ Task failed: {e}")
+                continue
+            completed.extend(item for item in results if item[1] is not None)
+        
+        # Keep repository order so the step 2/3 prompts are deterministic
+        completed.sort(key=lambda item: item[0])
+        return [result for _, result in completed]
+    
+    async def _read_code_file(self, file_path: str) -> Optional[str]:
+        """
+        Read the head of a code file, up to MAX_ANALYZED_FILE_BYTES.
+        
+        At most one byte past the cap is read, so a long file never passes
+        through memory or the prompts in full; its listing ends with a banner
+        telling the model it was truncated. (The file filter has already
+        dropped files that are too large to be worth reading at all.)
+        """
+        try:
+            async with aiofiles.open(file_path, 'rb') as f:
+                data = await f.read(MAX_ANALYZED_FILE_BYTES + 1)
+            
+            # Match text-mode reads: universal newlines, undecodable bytes replaced
+            text = data[:MAX_ANALYZED_FILE_BYTES].decode('utf-8', errors='replace')
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+            if len(data) > MAX_ANALYZED_FILE_BYTES:
+                text += f"\n\n[... file truncated after the first {MAX_ANALYZED_FILE_BYTES} bytes ...]"
+            return text
+        except Exception as e:
+            print(f"❌ Error reading file {file_path}: {e}")
+            return None
+    
+    @staticmethod
+    def _file_messages(content: str) -> list:
+        """Build the per-file analysis prompt."""
+        # Use simplified prompt as specified
+        return [
+            {"role": "system", "content": "You are a senior software architect."},
+            {"role": "user", "content": f"Analyze this code:\n\n```{content}```"}
+        ]
+    
+    def _context_cache_key(self, content: str) -> str:
+        """Cache key for a file's analysis (identical files reuse their analysis)."""
+        return hashlib.blake2b(
+            json.dumps(self._file_messages(content)).encode('utf-8'), digest_size=16
+        ).hexdigest()
+    
+    async def _analyze_group(
+        self,
+        group: List[Tuple[int, str, str]]
+    ) -> List[Tuple[int, Optional[Dict[str, str]]]]:
+        """
+        Analyze a group of (index, file_path, content) entries.
         
-        # Filter out exceptions and None results
-        file_contexts = []
-        successful = 0
-        errors = 0
+        Groups of several small files are sent as one request; any file the
+        batched answer does not cover is analyzed on its own.
+        """
+        contexts: Dict[str, Optional[str]] = {}
+        if len(group) > 1:
+            try:
+                contexts.update(await self._request_batch_contexts(group))
+            except Exception as e:
+                print(f"⚠️ Batched analysis failed, analyzing {len(group)} files individually: {e}")
         
-        for result in results:
-            if isinstance(result, Exception):
-                errors += 1
-                print(f"❌ Task failed: {result}")
-            elif result is not None:
-                file_contexts.append(result)
-                successful += 1
-            else:
-                errors += 1
+        missing = [(file_path, content) for _, file_path, content in group if file_path not in contexts]
+        fallback = await asyncio.gather(
+            *[self._request_file_context(file_path, content) for file_path, content in missing]
+        )
+        contexts.update(zip([file_path for file_path, _ in missing], fallback))
         
-        # print(f"✅ Completed: {successful} files analyzed, {errors} errors")
-        return file_contexts
-
-    async def _analyze_single_file(self, file_path: str) -> Optional[Dict[str, str]]:
+        results = []
+        for index, file_path, content in group:
+            context = contexts.get(file_path)
+            if context is None:
+                results.append((index, None))
+                continue
+            self.context_cache.set(self._context_cache_key(content), context)
+            # Store with fileName, context, and code as specified
+            results.append((index, {"fileName": file_path, "context": context, "code": content}))
+        return results
+    
+    async def _request_file_context(self, file_path: str, content: str) -> Optional[str]:
         """Analyze a single file with semaphore-based concurrency control."""
         async with self.semaphore:  # Limit concurrent API calls
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Skip very large files (> 10KB)
-                if len(content) > 500000:
-                    print(f"⏭️  Skipping large file: {file_path} ({len(content)} bytes)")
-                    return None
-                
                 print(f"🔍 Analyzing: {file_path}")
-                
-                # Use simplified prompt as specified
-                messages = [
-                    {"role": "system", "content": "You are a senior software architect."},
-                    {"role": "user", "content": f"Analyze this code:\n\n```{content}```"}
-                ]
-                
-                context = await self.llama_client.generate_response_with_messages(messages)
-                
-                # print(f"✅ Completed: {file_path}")
-                
-                # Store with fileName, context, and code as specified
-                return {
-                    "fileName": file_path,
-                    "context": context,
-                    "code": content
-                }
-                
+                return await self.llama_client.generate_response_with_messages(self._file_messages(content))
             except Exception as e:
                 print(f"❌ Error analyzing file {file_path}: {e}")
                 return None
     
-    async def _generate_exhaustive_summary(self, file_contexts: List[Dict[str, str]]) -> str:
-        """Step 2: Generate exhaustive summary of what problem the repo solves."""
-        # Prepare context with file information
-        context_data = []
-        for file_context in file_contexts:
-            context_data.append(f"File: {file_context['fileName']}")
-            context_data.append(f"Context: {file_context['context']}")
-            context_data.append(f"Code: {file_context['code']}")
-            context_data.append("-" * 50)
+    async def _request_batch_contexts(self, group: List[Tuple[int, str, str]]) -> Dict[str, str]:
+        """
+        Analyze several small files with one LLAMA request.
+        
+        Returns:
+            Analysis text keyed by file path, for the files the response covered
+        """
+        buffer = io.StringIO()
+        buffer.write(
+            "Analyze each of the following code files. Respond with only a JSON array "
+            "holding one {\"fileName\": ..., \"context\": ...} object per file, where "
+            "fileName is the path shown after '--- file:' and context is your analysis of that file.\n"
+        )
+        for _, file_path, content in group:
+            buffer.write(f"\n--- file: {file_path} ---\n")
+            buffer.write(content)
+            buffer.write("\n")
         
-        context_string = "\n".join(context_data)
+        messages = [
+            {"role": "system", "content": "You are a senior software architect."},
+            {"role": "user", "content": buffer.getvalue()}
+        ]
         
+        async with self.semaphore:  # Limit concurrent API calls
+            print(f"🔍 Analyzing {len(group)} small files in one request")
+            response = await self.llama_client.generate_response_with_messages(messages)
+        
+        # The array may come wrapped in a markdown code fence
+        match = _JSON_ARRAY_RE.search(response)
+        entries = json.loads(match.group() if match else response)
+        return {
+            entry["fileName"]: entry["context"]
+            for entry in entries
+            if isinstance(entry, dict) and isinstance(entry.get("context"), str)
+        }
+    
+    @staticmethod
+    def _build_context_string(file_contexts: List[Dict[str, str]]) -> str:
+        """Render analyzed files as the File/Context/Code listing sent to LLAMA."""
+        separator = "-" * 50
+        buffer = io.StringIO()
+        for index, file_context in enumerate(file_contexts):
+            if index:
+                buffer.write("\n")
+            buffer.write("File: ")
+            buffer.write(file_context['fileName'])
+            buffer.write("\nContext: ")
+            buffer.write(file_context['context'])
+            buffer.write("\nCode: ")
+            buffer.write(file_context['code'])
+            buffer.write("\n")
+            buffer.write(separator)
+        return buffer.getvalue()
+    
+    async def _generate_exhaustive_summary(self, context_string: str) -> str:
+        """Step 2: Generate exhaustive summary of what problem the repo solves."""
         # Generate exhaustive summary
         messages = [
             {"role": "system", "content": "You are a senior software architect."},
@@ -204,18 +456,8 @@ class CodeAnalyzerAgent:
         except Exception as e:
             return f"Error generating exhaustive summary: {str(e)}"
     
-    async def _generate_detailed_analysis(self, file_contexts: List[Dict[str, str]]) -> Dict[str, Any]:
+    async def _generate_detailed_analysis(self, context_string: str) -> Dict[str, Any]:
         """Step 3: Generate detailed analysis with specific structure."""
-        # Prepare context with file information
-        context_data = []
-        for file_context in file_contexts:
-            context_data.append(f"File: {file_context['fileName']}")
-            context_data.append(f"Context: {file_context['context']}")
-            context_data.append(f"Code: {file_context['code']}")
-            context_data.append("-" * 50)
-        
-        context_string = "\n".join(context_data)
-        
         # Generate detailed analysis with specified prompt
         messages = [
             {"role": "system", "content": "You are a senior software architect."},
@@ -259,11 +501,11 @@ Please return your analysis in the following JSON format:
         ]
         
         try:
-            response = await self.llama_client.generate_response_with_messages(messages)
+            response, parsed = await self._stream_json_response(messages)
             
             # Try to parse JSON response
             try:
-                return json.loads(response)
+                return parsed if parsed is not None else json.loads(response)
             except json.JSONDecodeError:
                 # If JSON parsing fails, create structured response
                 return {
@@ -284,19 +526,51 @@ Please return your analysis in the following JSON format:
                 "improvements": []
             }
     
+    async def _stream_json_response(self, messages: list) -> Tuple[str, Optional[Any]]:
+        """
+        Stream a LLAMA response, parsing it as JSON while it arrives.
+        
+        Returns:
+            The full response text and the parsed JSON value, or None if the
+            response was not valid JSON (or ijson is unavailable)
+        """
+        chunks = []
+        values = None
+        parser = None
+        if IJSON_AVAILABLE:
+            values = ijson.sendable_list()
+            parser = ijson.items_coro(values, '', use_float=True)
+        
+        async for chunk in self.llama_client.generate_response_stream(messages):
+            chunks.append(chunk)
+            if parser is not None:
+                try:
+                    parser.send(chunk.encode('utf-8'))
+                except ijson.JSONError:
+                    # Not JSON (e.g. prose or markdown); keep collecting text only
+                    parser = None
+        
+        response = "".join(chunks)
+        if parser is None:
+            return response, None
+        
+        try:
+            parser.close()
+        except ijson.JSONError:
+            return response, None
+        return response, values[0] if values else None
+    
     def _extract_technologies(self, text: str) -> List[str]:
         """Extract technologies from analysis text."""
         # Simple keyword extraction for common technologies
-        technologies = []
-        tech_keywords = [
-            'python', 'javascript', 'typescript', 'react', 'vue', 'angular',
-            'node.js', 'express', 'fastapi', 'django', 'flask', 'spring',
-            'java', 'c++', 'c#', 'go', 'rust', 'php', 'ruby', 'rails',
-            'postgresql', 'mysql', 'mongodb', 'redis', 'docker', 'kubernetes'
-        ]
-        
         text_lower = text.lower()
-        for tech in tech_keywords:
+        
+        if AHOCORASICK_AVAILABLE:
+            # One scan reports every (possibly overlapping) keyword occurrence
+            return list({tech.title() for _, tech in _TECH_AUTOMATON.iter(text_lower)})
+        
+        technologies = []
+        for tech in TECH_KEYWORDS:
             if tech in text_lower:
                 technologies.append(tech.title())
         
@@ -305,37 +579,26 @@ Please return your analysis in the following JSON format:
     def _extract_pitfalls(self, text: str) -> List[str]:
         """Extract pitfalls from analysis text."""
         # Extract sentences containing pitfall indicators
-        pitfall_indicators = [
-            'issue', 'problem', 'pitfall', 'vulnerability', 'anti-pattern',
-            'tight coupling', 'missing', 'lacks', 'weakness'
-        ]
-        
-        sentences = text.split('.')
-        pitfalls = []
-        
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if any(indicator in sentence.lower() for indicator in pitfall_indicators):
-                if len(sentence) > 10:  # Filter out very short sentences
-                    pitfalls.append(sentence)
-        
-        return pitfalls[:5]  # Return top 5 pitfalls
+        return self._extract_sentences(text, _PITFALL_RE)  # Return top 5 pitfalls
     
     def _extract_improvements(self, text: str) -> List[str]:
         """Extract improvements from analysis text."""
         # Extract sentences containing improvement indicators
-        improvement_indicators = [
-            'recommend', 'improve', 'enhancement', 'should', 'could',
-            'better', 'optimize', 'refactor', 'implement'
-        ]
-        
-        sentences = text.split('.')
-        improvements = []
-        
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if any(indicator in sentence.lower() for indicator in improvement_indicators):
-                if len(sentence) > 10:  # Filter out very short sentences
-                    improvements.append(sentence)
+        return self._extract_sentences(text, _IMPROVEMENT_RE)  # Return top 5 improvements
+    
+    @staticmethod
+    def _extract_sentences(text: str, indicators: re.Pattern, limit: int = 5) -> List[str]:
+        """
+        Collect up to limit sentences matching any indicator.
         
-        return improvements[:5]  # Return top 5 improvements 
\ No newline at end of file
+        Sentences are scanned lazily, so the scan stops once limit matches are found.
+        """
+        matches = []
+        for match in _SENTENCE_RE.finditer(text):
+            sentence = match.group().strip()
+            # Filter out very short sentences
+            if len(sentence) > 10 and indicators.search(sentence):
+                matches.append(sentence)
+                if len(matches) == limit:
+                    break
+        return matches 
\ No newline at end of file
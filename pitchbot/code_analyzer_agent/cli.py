@@ -9,6 +9,7 @@ from typing import Optional
 import argparse
 
 from .agent import CodeAnalyzerAgent
+from .llama_client import LlamaClient
 
 
 async def analyze_repository(github_url: str, api_key: Optional[str] = None) -> dict:
@@ -35,6 +36,8 @@ async def analyze_repository(github_url: str, api_key: Optional[str] = None) ->
             "pitfalls": [],
             "improvements": []
         }
+    finally:
+        await LlamaClient.close_shared_session()
 
 
 def main():
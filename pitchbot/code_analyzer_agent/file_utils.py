@@ -3,55 +3,99 @@ File utilities for filtering and processing code files.
 """
 
 import os
+import re
 from pathlib import Path
-from typing import List, Set
+from typing import Iterator, List, Set, Tuple
+
+from ._language_map import detect_language
+
+# Optional Aho-Corasick automaton for matching all directory patterns in one pass
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Files larger than this (in bytes) are not considered code worth analyzing
+MAX_CODE_FILE_BYTES = 100 * 1024
 
 
 class CodeFileFilter:
     """Utility class for filtering code files from repositories."""
     
+    # Code file extensions to include
+    code_extensions = frozenset({
+        '.py', '.js', '.ts', '.jsx', '.tsx', '.java', '.cpp', '.c',
+        '.h', '.hpp', '.cs', '.go', '.rs', '.php', '.rb', '.swift',
+        '.kt', '.scala', '.clj', '.hs', '.ml', '.fs', '.vb', '.pl',
+        '.sh', '.bash', '.zsh', '.fish', '.ps1', '.r', '.sql',
+        '.html', '.css', '.scss', '.less', '.vue', '.svelte'
+    })
+    
+    # Extensions to exclude (data, config, etc.)
+    exclude_extensions = frozenset({
+        '.md', '.txt', '.log', '.json', '.xml', '.yaml', '.yml',
+        '.csv', '.tsv', '.xlsx', '.xls', '.pdf', '.doc', '.docx',
+        '.png', '.jpg', '.jpeg', '.gif', '.svg', '.ico', '.bmp',
+        '.mp4', '.avi', '.mov', '.wmv', '.mp3', '.wav', '.ogg',
+        '.zip', '.tar', '.gz', '.rar', '.7z', '.jar', '.war',
+        '.pyc', '.pyo', '.class', '.o', '.so', '.dll', '.exe',
+        '.lock', '.toml', '.ini', '.cfg', '.conf', '.env'
+    })
+    
+    # Directory patterns to exclude
+    exclude_directories = frozenset({
+        '.git', '.svn', '.hg', '__pycache__', '.pytest_cache',
+        'node_modules', '.venv', 'venv', 'env', '.env',
+        'build', 'dist', 'target', 'bin', 'obj', '.idea',
+        '.vscode', '.vs', 'coverage', '.nyc_output', '.cache',
+        'logs', 'tmp', 'temp', '.tmp', '.sass-cache',
+        '.next', '.nuxt', 'out', 'public', 'static', 'assets'
+    })
+    
+    # Substrings that exclude a directory wherever they appear in its name
+    exclude_directory_patterns = (
+        'test', 'tests', '__test__', 'spec', 'specs',
+        'mock', 'mocks', 'fixture', 'fixtures',
+        'example', 'examples', 'demo', 'demos',
+        'doc', 'docs', 'documentation'
+    )
+    
+    # File name patterns to exclude (test files)
+    exclude_patterns = frozenset({
+        'test_', '_test', '.test.', '.spec.',
+        'tests.', 'spec.', 'mock', 'fixture',
+        'conftest', 'setup.py', 'setup.cfg',
+        'requirements.txt', 'package.json', 'package-lock.json',
+        'yarn.lock', 'Dockerfile', 'docker-compose',
+        'makefile', 'Makefile', 'CMakeLists.txt',
+        'README', 'LICENSE', 'CHANGELOG', 'CONTRIBUTING'
+    })
+    
+    # File name fragments that mark test files
+    test_indicators = frozenset({
+        'test_', '_test.', '.test.', '_test_',
+        'spec_', '_spec.', '.spec.', '_spec_',
+        'tests.', 'specs.',
+        'conftest.', 'test.py', 'tests.py'
+    })
+    
+    # Directories whose files are all tests
+    test_directories = frozenset({'test', 'tests', 'spec', 'specs', '__tests__'})
+    
+    # Precomputed so each candidate file costs one set lookup and a couple of regex scans
+    _accepted_exts = code_extensions - exclude_extensions
+    _name_reject_re = re.compile('|'.join(map(re.escape, sorted(exclude_patterns))))
+    _test_file_re = re.compile('|'.join(map(re.escape, sorted(test_indicators))))
+    
     def __init__(self):
-        """Initialize the file filter with predefined patterns."""
-        # Code file extensions to include
-        self.code_extensions = {
-            '.py', '.js', '.ts', '.jsx', '.tsx', '.java', '.cpp', '.c',
-            '.h', '.hpp', '.cs', '.go', '.rs', '.php', '.rb', '.swift',
-            '.kt', '.scala', '.clj', '.hs', '.ml', '.fs', '.vb', '.pl',
-            '.sh', '.bash', '.zsh', '.fish', '.ps1', '.r', '.sql',
-            '.html', '.css', '.scss', '.less', '.vue', '.svelte'
-        }
-        
-        # Extensions to exclude (data, config, etc.)
-        self.exclude_extensions = {
-            '.md', '.txt', '.log', '.json', '.xml', '.yaml', '.yml',
-            '.csv', '.tsv', '.xlsx', '.xls', '.pdf', '.doc', '.docx',
-            '.png', '.jpg', '.jpeg', '.gif', '.svg', '.ico', '.bmp',
-            '.mp4', '.avi', '.mov', '.wmv', '.mp3', '.wav', '.ogg',
-            '.zip', '.tar', '.gz', '.rar', '.7z', '.jar', '.war',
-            '.pyc', '.pyo', '.class', '.o', '.so', '.dll', '.exe',
-            '.lock', '.toml', '.ini', '.cfg', '.conf', '.env'
-        }
-        
-        # Directory patterns to exclude
-        self.exclude_directories = {
-            '.git', '.svn', '.hg', '__pycache__', '.pytest_cache',
-            'node_modules', '.venv', 'venv', 'env', '.env',
-            'build', 'dist', 'target', 'bin', 'obj', '.idea',
-            '.vscode', '.vs', 'coverage', '.nyc_output', '.cache',
-            'logs', 'tmp', 'temp', '.tmp', '.sass-cache',
-            '.next', '.nuxt', 'out', 'public', 'static', 'assets'
-        }
-        
-        # File name patterns to exclude (test files)
-        self.exclude_patterns = {
-            'test_', '_test', '.test.', '.spec.',
-            'tests.', 'spec.', 'mock', 'fixture',
-            'conftest', 'setup.py', 'setup.cfg',
-            'requirements.txt', 'package.json', 'package-lock.json',
-            'yarn.lock', 'Dockerfile', 'docker-compose',
-            'makefile', 'Makefile', 'CMakeLists.txt',
-            'README', 'LICENSE', 'CHANGELOG', 'CONTRIBUTING'
-        }
+        """Initialize the file filter's directory pattern automaton."""
+        self._dir_pattern_automaton = None
+        if AHOCORASICK_AVAILABLE:
+            self._dir_pattern_automaton = ahocorasick.Automaton()
+            for pattern in self.exclude_directory_patterns:
+                self._dir_pattern_automaton.add_word(pattern, pattern)
+            self._dir_pattern_automaton.make_automaton()
     
     def get_code_files(self, root_path: str) -> List[str]:
         """
@@ -63,22 +107,44 @@ class CodeFileFilter:
         Returns:
             List of file paths containing code files
         """
-        code_files = []
-        root_path = Path(root_path)
+        return list(self.iter_code_files(root_path))
+    
+    def iter_code_files(self, root_path: str) -> Iterator[str]:
+        """
+        Lazily yield relevant code files from the repository.
         
-        for file_path in self._walk_directory(root_path):
-            if self._is_code_file(file_path):
-                code_files.append(str(file_path))
+        Uses os.scandir so the file type and size come from the directory
+        entry (at most one stat per file) and oversized files are dropped
+        before anyone opens them.
         
-        return code_files
+        Args:
+            root_path: Root directory path to scan
+            
+        Yields:
+            Paths of code files
+        """
+        for entry, parent_dir in self._walk_directory(root_path):
+            if self._is_code_file(entry, parent_dir):
+                yield entry.path
     
-    def _walk_directory(self, root_path: Path):
-        """Walk through directory structure, excluding unwanted directories."""
-        for item in root_path.iterdir():
-            if item.is_file():
-                yield item
-            elif item.is_dir() and not self._should_exclude_directory(item.name):
-                yield from self._walk_directory(item)
+    def _walk_directory(self, root_path: str) -> Iterator[Tuple[os.DirEntry, str]]:
+        """
+        Walk through directory structure, excluding unwanted directories.
+        
+        Uses an explicit stack rather than recursion, so arbitrarily deep trees
+        cost no Python frames per level. Each file entry is yielded with the
+        lowercased name of its directory, computed once per directory.
+        """
+        stack = [root_path]
+        while stack:
+            dir_path = stack.pop()
+            parent_dir = os.path.basename(dir_path).lower()
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        yield entry, parent_dir
+                    elif entry.is_dir(follow_symlinks=False) and not self._should_exclude_directory(entry.name):
+                        stack.append(entry.path)
     
     def _should_exclude_directory(self, dir_name: str) -> bool:
         """Check if directory should be excluded."""
@@ -89,83 +155,63 @@ class CodeFileFilter:
             return True
         
         # Check patterns
-        exclude_patterns = [
-            'test', 'tests', '__test__', 'spec', 'specs',
-            'mock', 'mocks', 'fixture', 'fixtures',
-            'example', 'examples', 'demo', 'demos',
-            'doc', 'docs', 'documentation'
-        ]
-        
-        for pattern in exclude_patterns:
+        if self._dir_pattern_automaton is not None:
+            return next(self._dir_pattern_automaton.iter(dir_name_lower), None) is not None
+        
+        for pattern in self.exclude_directory_patterns:
             if pattern in dir_name_lower:
                 return True
         
         return False
     
-    def _is_code_file(self, file_path: Path) -> bool:
+    def _is_code_file(self, entry: os.DirEntry, parent_dir: str) -> bool:
         """
         Check if file is a code file that should be analyzed.
         
         Args:
-            file_path: Path to the file
+            entry: Directory entry of the file, as returned by os.scandir
+            parent_dir: Lowercased name of the directory containing the file
             
         Returns:
             True if file should be analyzed, False otherwise
         """
-        # Get file extension
-        extension = file_path.suffix.lower()
-        
-        # Check if extension is excluded
-        if extension in self.exclude_extensions:
-            return False
-        
-        # Check if extension is a code extension
-        if extension not in self.code_extensions:
+        if not self._is_code_file_name(entry.name, parent_dir):
             return False
         
-        # Check file name patterns
-        file_name = file_path.name.lower()
-        
-        for pattern in self.exclude_patterns:
-            if pattern in file_name:
-                return False
-        
-        # Additional checks for test files
-        if self._is_test_file(file_path):
-            return False
-        
-        # Check file size (skip very large files > 100KB)
+        # Check file size (skip very large files > 100KB); scandir caches the stat
         try:
-            if file_path.stat().st_size > 100 * 1024:
+            if entry.stat(follow_symlinks=False).st_size > MAX_CODE_FILE_BYTES:
                 return False
         except OSError:
             return False
         
         return True
     
-    def _is_test_file(self, file_path: Path) -> bool:
-        """Check if file is a test file based on various indicators."""
-        file_name = file_path.name.lower()
-        parent_dir = file_path.parent.name.lower()
+    def _is_code_file_name(self, file_name: str, parent_dir: str) -> bool:
+        """Check the extension and name patterns of a file (no filesystem access)."""
+        file_name = file_name.lower()
+        
+        # Get file extension (a leading dot marks a hidden file, not a suffix)
+        dot = file_name.rfind('.')
+        extension = file_name[dot:] if dot > 0 else ''
+        
+        # Check the extension first; most files are rejected here
+        if extension not in self._accepted_exts:
+            return False
         
         # Check file name patterns
-        test_indicators = [
-            'test_', '_test.', '.test.', '_test_',
-            'spec_', '_spec.', '.spec.', '_spec_',
-            'tests.', 'specs.',
-            'conftest.', 'test.py', 'tests.py'
-        ]
-        
-        for indicator in test_indicators:
-            if indicator in file_name:
-                return True
+        if self._name_reject_re.search(file_name):
+            return False
         
-        # Check parent directory
-        test_dirs = ['test', 'tests', 'spec', 'specs', '__tests__']
-        if parent_dir in test_dirs:
-            return True
+        # Additional checks for test files
+        if self._is_test_file(file_name, parent_dir):
+            return False
         
-        return False
+        return True
+    
+    def _is_test_file(self, file_name: str, parent_dir: str) -> bool:
+        """Check if file is a test file based on its lowercased name and parent directory."""
+        return bool(self._test_file_re.search(file_name)) or parent_dir in self.test_directories
     
     def get_file_info(self, file_path: str) -> dict:
         """
@@ -201,44 +247,4 @@ class CodeFileFilter:
     
     def _detect_language(self, extension: str) -> str:
         """Detect programming language from file extension."""
-        language_mapping = {
-            '.py': 'Python',
-            '.js': 'JavaScript',
-            '.ts': 'TypeScript',
-            '.jsx': 'React JSX',
-            '.tsx': 'React TSX',
-            '.java': 'Java',
-            '.cpp': 'C++',
-            '.c': 'C',
-            '.h': 'C Header',
-            '.hpp': 'C++ Header',
-            '.cs': 'C#',
-            '.go': 'Go',
-            '.rs': 'Rust',
-            '.php': 'PHP',
-            '.rb': 'Ruby',
-            '.swift': 'Swift',
-            '.kt': 'Kotlin',
-            '.scala': 'Scala',
-            '.clj': 'Clojure',
-            '.hs': 'Haskell',
-            '.ml': 'OCaml',
-            '.fs': 'F#',
-            '.vb': 'Visual Basic',
-            '.pl': 'Perl',
-            '.sh': 'Shell',
-            '.bash': 'Bash',
-            '.zsh': 'Zsh',
-            '.fish': 'Fish',
-            '.ps1': 'PowerShell',
-            '.r': 'R',
-            '.sql': 'SQL',
-            '.html': 'HTML',
-            '.css': 'CSS',
-            '.scss': 'SCSS',
-            '.less': 'Less',
-            '.vue': 'Vue',
-            '.svelte': 'Svelte'
-        }
-        
-        return language_mapping.get(extension.lower(), 'Unknown') 
\ No newline at end of file
+        return detect_language(extension) 
\ No newline at end of file
@@ -4,15 +4,33 @@ LLAMA API Client for code analysis.
 
 import os
 import json
+import ssl
 import asyncio
 import aiohttp
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator
 from pathlib import Path
 
+from ._language_map import detect_language
+
+# Connection pool shared by every LlamaClient; file analysis fans out to one host
+MAX_CONNECTIONS = 64
+MAX_CONNECTIONS_PER_HOST = 32
+DNS_CACHE_TTL_SECONDS = 300
+KEEPALIVE_TIMEOUT_SECONDS = 60
+
+# LLAMA requests in flight at once across all clients on an event loop
+MAX_INFLIGHT_REQUESTS = 32
+
 
 class LlamaClient:
     """Client for interacting with LLAMA API."""
     
+    # One pooled session per event loop, reused by all instances
+    _shared_session: Optional[aiohttp.ClientSession] = None
+    _shared_session_loop: Optional[asyncio.AbstractEventLoop] = None
+    _inflight_semaphore: Optional[asyncio.Semaphore] = None
+    _inflight_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+    
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize LLAMA client.
@@ -29,25 +47,59 @@ class LlamaClient:
     
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession()
+        self.session = self.get_shared_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self.session:
-            await self.session.close()
+        await self.close()
+    
+    @classmethod
+    def get_shared_session(cls) -> aiohttp.ClientSession:
+        """
+        Get or create the pooled session shared by all clients on the running loop.
+        
+        Keeping one session alive lets concurrent file analyses reuse warm
+        keep-alive connections instead of each paying for a TLS handshake.
+        """
+        loop = asyncio.get_running_loop()
+        if (
+            cls._shared_session is None
+            or cls._shared_session.closed
+            or cls._shared_session_loop is not loop
+        ):
+            connector = aiohttp.TCPConnector(
+                ssl=ssl.create_default_context(),
+                limit=MAX_CONNECTIONS,
+                limit_per_host=MAX_CONNECTIONS_PER_HOST,
+                ttl_dns_cache=DNS_CACHE_TTL_SECONDS,
+                keepalive_timeout=KEEPALIVE_TIMEOUT_SECONDS
+            )
+            cls._shared_session = aiohttp.ClientSession(connector=connector)
+            cls._shared_session_loop = loop
+        return cls._shared_session
+    
+    @classmethod
+    def _get_inflight_semaphore(cls) -> asyncio.Semaphore:
+        """Get the semaphore bounding concurrent LLAMA requests on the running loop."""
+        loop = asyncio.get_running_loop()
+        if cls._inflight_semaphore is None or cls._inflight_semaphore_loop is not loop:
+            cls._inflight_semaphore = asyncio.Semaphore(MAX_INFLIGHT_REQUESTS)
+            cls._inflight_semaphore_loop = loop
+        return cls._inflight_semaphore
+    
+    @classmethod
+    async def close_shared_session(cls):
+        """Close the shared session (call once when the event loop is shutting down)."""
+        if cls._shared_session is not None:
+            await cls._shared_session.close()
+            cls._shared_session = None
+            cls._shared_session_loop = None
     
     async def _get_session(self):
-        """Get or create aiohttp session."""
-        if not self.session:
-            # Create connector with SSL verification disabled for development
-            import ssl
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-            
-            connector = aiohttp.TCPConnector(ssl=ssl_context)
-            self.session = aiohttp.ClientSession(connector=connector)
+        """Get the shared aiohttp session."""
+        if not self.session or self.session.closed:
+            self.session = self.get_shared_session()
         return self.session
     
     async def analyze_code_file(self, file_path: str, content: str) -> str:
@@ -100,12 +152,28 @@ Keep the analysis concise but informative (2-3 sentences per point)."""
         """
         Generate response using LLAMA API with messages format.
         
+        The response is streamed and assembled here, so long generations do
+        not hold a pooled connection idle until the whole body is ready.
+        
         Args:
             messages: List of message objects with role and content
             
         Returns:
             Generated response from LLAMA
         """
+        chunks = [chunk async for chunk in self.generate_response_stream(messages)]
+        return "".join(chunks)
+
+    async def generate_response_stream(self, messages: list) -> AsyncIterator[str]:
+        """
+        Stream a LLAMA response as it is generated.
+        
+        Args:
+            messages: List of message objects with role and content
+            
+        Yields:
+            Text deltas of the response, in order
+        """
         session = await self._get_session()
         
         headers = {
@@ -117,51 +185,62 @@ Keep the analysis concise but informative (2-3 sentences per point)."""
             'model': 'Llama-4-Maverick-17B-128E-Instruct-FP8',
             'messages': messages,
             'temperature': 0.3,
+            'stream': True,
         }
         
-        # Debug: Print request details
-        # print(f"🔍 LLAMA API Request URL: {self.base_url}/v1/chat/completions")
-        # print(f"🔍 LLAMA API Request Payload:")
-        # print(json.dumps(payload, indent=2))
-        
         try:
-            async with session.post(
+            async with self._get_inflight_semaphore(), session.post(
                 f"{self.base_url}/v1/chat/completions",
                 headers=headers,
                 json=payload,
                 timeout=aiohttp.ClientTimeout(total=180)
             ) as response:
                 
-                # Debug: Print response status and headers
-                # print(f"🔍 LLAMA API Response Status: {response.status}")
-                # print(f"🔍 LLAMA API Response Headers: {dict(response.headers)}")
+                if response.status != 200:
+                    error_text = await response.text()
+                    print(f"🔍 LLAMA API Error Response: {error_text}")
+                    raise Exception(f"LLAMA API error {response.status}: {error_text}")
                 
-                if response.status == 200:
+                # Some deployments ignore "stream" and answer with a single JSON body
+                if response.content_type == 'application/json':
                     data = await response.json()
-                    
-                    # Debug: Print full response
-                    # print(f"🔍 LLAMA API Full Response:")
-                    # print(json.dumps(data, indent=2))
-                    
-                    # LLAMA API uses different response format than OpenAI
                     if 'completion_message' in data:
                         # LLAMA API format
-                        return data['completion_message']['content']['text']
+                        yield data['completion_message']['content']['text']
                     elif 'choices' in data:
                         # OpenAI format (fallback)
-                        return data['choices'][0]['message']['content']
+                        yield data['choices'][0]['message']['content']
                     else:
                         raise Exception(f"Unexpected LLAMA API response format: {list(data.keys())}")
-                else:
-                    error_text = await response.text()
-                    print(f"🔍 LLAMA API Error Response: {error_text}")
-                    raise Exception(f"LLAMA API error {response.status}: {error_text}")
+                    return
+                
+                # Server-sent events, one "data: {...}" line per delta
+                async for raw_line in response.content:
+                    line = raw_line.decode('utf-8').strip()
+                    if not line.startswith('data:'):
+                        continue
+                    data = line[len('data:'):].strip()
+                    if data == '[DONE]':
+                        break
+                    
+                    event = json.loads(data)
+                    if 'event' in event:
+                        # LLAMA API format
+                        text = event['event'].get('delta', {}).get('text')
+                    elif 'choices' in event:
+                        # OpenAI format (fallback)
+                        text = event['choices'][0].get('delta', {}).get('content')
+                    else:
+                        text = None
+                    
+                    if text:
+                        yield text
                     
         except asyncio.TimeoutError:
             raise Exception("LLAMA API request timed out")
         except aiohttp.ClientError as e:
             raise Exception(f"LLAMA API client error: {str(e)}")
-        except KeyError as e:
+        except (KeyError, json.JSONDecodeError) as e:
             raise Exception(f"Unexpected LLAMA API response format: {str(e)}")
 
     async def generate_response(self, prompt: str) -> str:
@@ -189,50 +268,8 @@ Keep the analysis concise but informative (2-3 sentences per point)."""
     
     def _detect_language(self, extension: str) -> str:
         """Detect programming language from file extension."""
-        language_mapping = {
-            '.py': 'Python',
-            '.js': 'JavaScript',
-            '.ts': 'TypeScript',
-            '.jsx': 'React JSX',
-            '.tsx': 'React TSX',
-            '.java': 'Java',
-            '.cpp': 'C++',
-            '.c': 'C',
-            '.h': 'C Header',
-            '.hpp': 'C++ Header',
-            '.cs': 'C#',
-            '.go': 'Go',
-            '.rs': 'Rust',
-            '.php': 'PHP',
-            '.rb': 'Ruby',
-            '.swift': 'Swift',
-            '.kt': 'Kotlin',
-            '.scala': 'Scala',
-            '.clj': 'Clojure',
-            '.hs': 'Haskell',
-            '.ml': 'OCaml',
-            '.fs': 'F#',
-            '.vb': 'Visual Basic',
-            '.pl': 'Perl',
-            '.sh': 'Shell',
-            '.bash': 'Bash',
-            '.zsh': 'Zsh',
-            '.fish': 'Fish',
-            '.ps1': 'PowerShell',
-            '.r': 'R',
-            '.sql': 'SQL',
-            '.html': 'HTML',
-            '.css': 'CSS',
-            '.scss': 'SCSS',
-            '.less': 'Less',
-            '.vue': 'Vue',
-            '.svelte': 'Svelte'
-        }
-        
-        return language_mapping.get(extension.lower(), 'Unknown')
+        return detect_language(extension)
     
     async def close(self):
-        """Close the HTTP session."""
-        if self.session:
-            await self.session.close()
-            self.session = None 
\ No newline at end of file
+        """Release the HTTP session; the shared pool stays open for other clients."""
+        self.session = None 
\ No newline at end of file
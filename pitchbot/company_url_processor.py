@@ -4,13 +4,84 @@ Company URL Processor for PitchBot
 Handles processing of company URLs using the advanced RobustWebsiteScraper for comprehensive analysis.
 """
 
-from typing import Optional
-from urllib.parse import urlparse
+import asyncio
+import heapq
+import io
+import re
+from operator import attrgetter
+from typing import Optional, Tuple
+from urllib.parse import urlsplit, urlunsplit
 from datetime import datetime
 import time
 
 from .website_scraper import RobustWebsiteScraper
 
+# Optional Aho-Corasick automaton for matching all insight keywords in one pass
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# An http(s) URL with a non-empty host
+_URL_RE = re.compile(r'^https?://[^/?#\s]+', re.IGNORECASE)
+
+# Report section rules
+_SEP80 = "=" * 80
+_SEP40 = "-" * 40
+
+# Report line templates, bound once for the per-item loops
+_FMT_INSIGHT = "  {}. {}\n".format
+_FMT_TOP_PAGE = "  {}. {}\n     URL: {}\n     Score: {:.2f}, Words: {:,}\n".format
+
+# Keywords for each insight category, checked in order (first match wins)
+CATEGORY_KEYWORDS = {
+    "Product Market Fit": ["product", "market", "customer", "user", "solution", "problem", "need", "demand", "target"],
+    "Business Model": ["revenue", "monetization", "pricing", "subscription", "business model", "sales", "profit", "income"],
+    "Technology": ["technology", "technical", "platform", "software", "API", "infrastructure", "development", "engineering"],
+    "Competitive Landscape": ["competitor", "competition", "advantage", "differentiation", "market position", "unique"],
+    "Company Culture": ["culture", "values", "mission", "vision", "team", "employee", "workplace", "diversity"],
+    "Leadership": ["founder", "CEO", "executive", "leadership", "management", "board", "advisor"],
+    "Funding & Growth": ["funding", "investment", "growth", "expansion", "scale", "series", "venture", "capital"],
+    "Partnerships": ["partner", "partnership", "collaboration", "integration", "alliance", "relationship"]
+}
+
+# Report order of the categories; insights matching no keyword go to General
+INSIGHT_CATEGORIES = [*CATEGORY_KEYWORDS, "General"]
+
+# One alternation per category, matched as substrings (so "customers" counts as "customer")
+_CATEGORY_KEYWORD_RES = [
+    (category, re.compile("|".join(map(re.escape, keywords))))
+    for category, keywords in CATEGORY_KEYWORDS.items()
+]
+
+# Every keyword mapped to the position of its earliest category in INSIGHT_CATEGORIES
+if AHOCORASICK_AVAILABLE:
+    _CATEGORY_AUTOMATON = ahocorasick.Automaton()
+    for _rank, _keywords in enumerate(CATEGORY_KEYWORDS.values()):
+        for _keyword in _keywords:
+            if _keyword not in _CATEGORY_AUTOMATON:
+                _CATEGORY_AUTOMATON.add_word(_keyword, _rank)
+    _CATEGORY_AUTOMATON.make_automaton()
+
+
+def _categorize_point(point_lower: str) -> str:
+    """Return the first category (in order) with a keyword in the point, or General."""
+    if AHOCORASICK_AVAILABLE:
+        # One scan finds every keyword; the earliest category wins, not the earliest match
+        best = len(CATEGORY_KEYWORDS)
+        for _, rank in _CATEGORY_AUTOMATON.iter(point_lower):
+            if rank < best:
+                best = rank
+                if best == 0:
+                    break
+        return INSIGHT_CATEGORIES[best]
+    
+    for category, keyword_re in _CATEGORY_KEYWORD_RES:
+        if keyword_re.search(point_lower):
+            return category
+    return "General"
+
 
 async def process_company_url(company_url: str) -> str:
     """
@@ -28,12 +99,12 @@ async def process_company_url(company_url: str) -> str:
     print(f"🌐 Company URL processing started for: {company_url}")
 
     # Validate URL format
-    try:
-        parsed_url = urlparse(company_url)
-        if not (parsed_url.scheme and parsed_url.netloc):
-            return f"❌ Invalid URL format: {company_url}"
-    except Exception as e:
-        return f"❌ URL parsing error: {e}"
+    if not _URL_RE.match(company_url):
+        return f"❌ Invalid URL format: {company_url}"
+    
+    # The scraper records the homepage without a trailing slash; use the same form
+    # everywhere so the report can find the homepage result
+    company_url = canonicalize_company_url(company_url)
 
     print(f"🔍 Starting comprehensive website analysis...")
     
@@ -61,11 +132,11 @@ async def process_company_url(company_url: str) -> str:
         summary = scraper.get_results_summary()
         processing_time = time.time() - start_time
         
-        # Format the results into a comprehensive report
-        formatted_result = format_company_url_analysis_v2(results, summary, company_url, processing_time)
-        
-        successful_pages = len([r for r in results if not r.error])
-        total_key_points = sum(len(r.key_points) for r in results if not r.error)
+        # Format the results into a comprehensive report, off the event loop so the
+        # other pitch modules running alongside keep making progress
+        formatted_result, successful_pages, total_key_points = await asyncio.to_thread(
+            format_company_url_analysis_v2, results, summary, company_url, processing_time
+        )
         
         print(f"✅ Company URL processing complete")
         print(f"📊 Processed {successful_pages} pages, extracted {total_key_points} key insights")
@@ -78,7 +149,35 @@ async def process_company_url(company_url: str) -> str:
         return error_msg
 
 
-def format_company_url_analysis_v2(results: list, summary: dict, company_url: str, processing_time: float) -> str:
+def canonicalize_company_url(company_url: str) -> str:
+    """
+    Normalize a validated company URL the way RobustWebsiteScraper records pages.
+    
+    Lowercases the scheme and host, drops any fragment and removes trailing
+    slashes from the path.
+    
+    Args:
+        company_url: An http(s) URL
+        
+    Returns:
+        Canonical form of the URL
+    """
+    parts = urlsplit(company_url)
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        parts.path.rstrip('/'),
+        parts.query,
+        ''
+    ))
+
+
+def format_company_url_analysis_v2(
+    results: list,
+    summary: dict,
+    company_url: str,
+    processing_time: float
+) -> Tuple[str, int, int]:
     """
     Format the company URL analysis results from RobustWebsiteScraper into a readable report.
     
@@ -89,108 +188,110 @@ def format_company_url_analysis_v2(results: list, summary: dict, company_url: st
         processing_time: Total processing time
         
     Returns:
-        Formatted analysis report
+        Tuple of (formatted analysis report, successful page count, key point count),
+        the counts coming from the same pass that builds the report
     """
-    report_lines = []
+    buffer = io.StringIO()
+    w = buffer.write
     
     # Header
-    report_lines.append("=" * 80)
-    report_lines.append("🌐 COMPANY WEBSITE ANALYSIS REPORT")
-    report_lines.append("=" * 80)
+    w(f"{_SEP80}\n🌐 COMPANY WEBSITE ANALYSIS REPORT\n{_SEP80}\n")
     
     # Website Info
-    report_lines.append(f"\n🔗 WEBSITE INFORMATION:")
-    report_lines.append("-" * 40)
-    report_lines.append(f"URL: {company_url}")
+    w(f"\n🔗 WEBSITE INFORMATION:\n{_SEP40}\n")
+    w(f"URL: {company_url}\n")
     
-    # Get homepage info for title/description
-    homepage_result = next((r for r in results if r.page_info.url == company_url), None)
-    if not homepage_result:
-        homepage_result = next((r for r in results if not r.error), None)
+    # One pass collects the successful pages, their statistics and key points,
+    # and the homepage (the page at company_url, even if it failed)
+    successful_results = []
+    all_key_points = []
+    total_words = 0
+    total_score = 0.0
+    homepage_result = None
+    for r in results:
+        page_info = r.page_info
+        if homepage_result is None and page_info.url == company_url:
+            homepage_result = r
+        if r.error:
+            continue
+        successful_results.append(r)
+        total_words += page_info.word_count
+        total_score += page_info.content_score
+        all_key_points.extend(r.key_points)
+    
+    # Blank points carry no insight; drop them once so every section below can skip the check
+    all_key_points = [point for point in all_key_points if point and not point.isspace()]
+    
+    # Fall back to the first successful page for title/description
+    if homepage_result is None and successful_results:
+        homepage_result = successful_results[0]
     
     if homepage_result and homepage_result.page_info.title:
-        report_lines.append(f"Title: {homepage_result.page_info.title}")
+        w(f"Title: {homepage_result.page_info.title}\n")
     
     session_info = summary.get("scraping_session", {})
-    report_lines.append(f"Extraction Method: Advanced website scraping")
-    report_lines.append(f"Processing Time: {processing_time:.2f} seconds")
-    report_lines.append(f"Pages Analyzed: {session_info.get('successful_pages', 0)}")
+    w(f"Extraction Method: Advanced website scraping\n")
+    w(f"Processing Time: {processing_time:.2f} seconds\n")
+    w(f"Pages Analyzed: {session_info.get('successful_pages', 0)}\n")
     
     # Content Statistics (aggregate)
-    successful_results = [r for r in results if not r.error]
-    total_words = sum(r.page_info.word_count for r in successful_results)
-    avg_content_score = sum(r.page_info.content_score for r in successful_results) / len(successful_results) if successful_results else 0
-    
-    report_lines.append(f"\n📊 CONTENT STATISTICS:")
-    report_lines.append("-" * 40)
-    report_lines.append(f"Total Word Count: {total_words:,}")
-    report_lines.append(f"Average Content Score: {avg_content_score:.2f}")
-    report_lines.append(f"Pages Successfully Processed: {len(successful_results)}")
-    if session_info.get('failed_pages', 0) > 0:
-        report_lines.append(f"Pages Failed: {session_info['failed_pages']}")
+    avg_content_score = total_score / len(successful_results) if successful_results else 0
     
-    # Categorize key insights by analyzing content
-    all_key_points = []
-    for result in successful_results:
-        all_key_points.extend(result.key_points)
+    w(f"\n📊 CONTENT STATISTICS:\n{_SEP40}\n")
+    w(f"Total Word Count: {total_words:,}\n")
+    w(f"Average Content Score: {avg_content_score:.2f}\n")
+    w(f"Pages Successfully Processed: {len(successful_results)}\n")
+    if session_info.get('failed_pages', 0) > 0:
+        w(f"Pages Failed: {session_info['failed_pages']}\n")
     
     # Simple categorization based on keywords
     categorized_insights = categorize_insights(all_key_points)
     
     if categorized_insights:
-        report_lines.append(f"\n🎯 COMPANY INSIGHTS BY CATEGORY:")
-        report_lines.append("-" * 40)
+        w(f"\n🎯 COMPANY INSIGHTS BY CATEGORY:\n{_SEP40}\n")
         
         for category, points in categorized_insights.items():
             if points:  # Only show categories with points
-                report_lines.append(f"\n📌 {category.upper()}:")
-                for i, point in enumerate(points, 1):
-                    if point.strip():  # Only show non-empty points
-                        report_lines.append(f"  {i}. {point}")
+                w(f"\n📌 {category.upper()}:\n")
+                w("".join(map(_FMT_INSIGHT, range(1, len(points) + 1), points)))
     
     # Top Pages by Content Quality
     if len(successful_results) > 1:
-        report_lines.append(f"\n🏆 TOP CONTENT PAGES:")
-        report_lines.append("-" * 40)
-        top_pages = sorted(successful_results, key=lambda r: r.page_info.content_score, reverse=True)[:5]
-        for i, result in enumerate(top_pages, 1):
-            title = result.page_info.title or "Untitled"
-            score = result.page_info.content_score
-            words = result.page_info.word_count
-            report_lines.append(f"  {i}. {title}")
-            report_lines.append(f"     URL: {result.page_info.url}")
-            report_lines.append(f"     Score: {score:.2f}, Words: {words:,}")
+        w(f"\n🏆 TOP CONTENT PAGES:\n{_SEP40}\n")
+        top_pages = heapq.nlargest(5, successful_results, key=attrgetter("page_info.content_score"))
+        w("".join([
+            _FMT_TOP_PAGE(i, page.title or 'Untitled', page.url, page.content_score, page.word_count)
+            for i, page in enumerate([result.page_info for result in top_pages], 1)
+        ]))
     
     # All Key Insights (Flat List)
     if all_key_points:
-        report_lines.append(f"\n📝 ALL KEY INSIGHTS:")
-        report_lines.append("-" * 40)
-        for i, point in enumerate(all_key_points[:30], 1):  # Limit to top 30 for readability
-            report_lines.append(f"  {i}. {point}")
+        w(f"\n📝 ALL KEY INSIGHTS:\n{_SEP40}\n")
+        # Limit to top 30 for readability
+        shown_points = all_key_points[:30]
+        w("".join(map(_FMT_INSIGHT, range(1, len(shown_points) + 1), shown_points)))
         
         if len(all_key_points) > 30:
-            report_lines.append(f"  ... and {len(all_key_points) - 30} more insights")
+            w(f"  ... and {len(all_key_points) - 30} more insights\n")
     
     # Processing Details
     config = session_info.get('configuration', {})
-    report_lines.append(f"\n📋 PROCESSING CONFIGURATION:")
-    report_lines.append("-" * 40)
-    report_lines.append(f"Max Depth: {config.get('max_depth', 'N/A')}")
-    report_lines.append(f"Max Pages: {config.get('max_pages', 'N/A')}")
-    report_lines.append(f"Content Threshold: {config.get('content_threshold', 'N/A')}")
-    report_lines.append(f"Concurrent Requests: {config.get('concurrent_requests', 'N/A')}")
+    w(f"\n📋 PROCESSING CONFIGURATION:\n{_SEP40}\n")
+    w(f"Max Depth: {config.get('max_depth', 'N/A')}\n")
+    w(f"Max Pages: {config.get('max_pages', 'N/A')}\n")
+    w(f"Content Threshold: {config.get('content_threshold', 'N/A')}\n")
+    w(f"Concurrent Requests: {config.get('concurrent_requests', 'N/A')}\n")
     
     # Summary
-    report_lines.append(f"\n📈 ANALYSIS SUMMARY:")
-    report_lines.append("-" * 40)
-    report_lines.append(f"Total Key Insights Extracted: {len(all_key_points)}")
-    report_lines.append(f"Categories Identified: {len(categorized_insights)}")
-    report_lines.append(f"Pages Analyzed: {len(successful_results)}")
-    report_lines.append(f"Processing Status: ✅ Success")
+    w(f"\n📈 ANALYSIS SUMMARY:\n{_SEP40}\n")
+    w(f"Total Key Insights Extracted: {len(all_key_points)}\n")
+    w(f"Categories Identified: {len(categorized_insights)}\n")
+    w(f"Pages Analyzed: {len(successful_results)}\n")
+    w(f"Processing Status: ✅ Success\n")
     
-    report_lines.append("\n" + "=" * 80)
+    w(f"\n{_SEP80}")
     
-    return "\n".join(report_lines)
+    return buffer.getvalue(), len(successful_results), len(all_key_points)
 
 
 def categorize_insights(key_points: list) -> dict:
@@ -203,44 +304,10 @@ def categorize_insights(key_points: list) -> dict:
     Returns:
         Dictionary with categorized insights
     """
-    categories = {
-        "Product Market Fit": [],
-        "Business Model": [],
-        "Technology": [],
-        "Competitive Landscape": [],
-        "Company Culture": [],
-        "Leadership": [],
-        "Funding & Growth": [],
-        "Partnerships": [],
-        "General": []
-    }
-    
-    # Keywords for each category
-    category_keywords = {
-        "Product Market Fit": ["product", "market", "customer", "user", "solution", "problem", "need", "demand", "target"],
-        "Business Model": ["revenue", "monetization", "pricing", "subscription", "business model", "sales", "profit", "income"],
-        "Technology": ["technology", "technical", "platform", "software", "API", "infrastructure", "development", "engineering"],
-        "Competitive Landscape": ["competitor", "competition", "advantage", "differentiation", "market position", "unique"],
-        "Company Culture": ["culture", "values", "mission", "vision", "team", "employee", "workplace", "diversity"],
-        "Leadership": ["founder", "CEO", "executive", "leadership", "management", "board", "advisor"],
-        "Funding & Growth": ["funding", "investment", "growth", "expansion", "scale", "series", "venture", "capital"],
-        "Partnerships": ["partner", "partnership", "collaboration", "integration", "alliance", "relationship"]
-    }
+    categories = {category: [] for category in INSIGHT_CATEGORIES}
     
     for point in key_points:
-        point_lower = point.lower()
-        categorized = False
-        
-        # Check each category for keyword matches
-        for category, keywords in category_keywords.items():
-            if any(keyword in point_lower for keyword in keywords):
-                categories[category].append(point)
-                categorized = True
-                break
-        
-        # If no category matched, put in General
-        if not categorized:
-            categories["General"].append(point)
+        categories[_categorize_point(point.lower())].append(point)
     
     # Remove empty categories
-    return {k: v for k, v in categories.items() if v} 
\ No newline at end of file
+    return {k: v for k, v in categories.items() if v}
@@ -0,0 +1,41 @@
+"""
+Logging helpers for PitchBot
+
+Shared setup for modules that log from inside the event loop.
+"""
+
+import logging
+import logging.handlers
+import queue
+import sys
+
+
+def start_log_listener(
+    target_logger: logging.Logger,
+    level: int = logging.INFO
+) -> logging.handlers.QueueListener:
+    """
+    Route a logger's records through a queue to a background thread.
+
+    Callers on the event loop only enqueue records; the blocking write to
+    stdout happens on the listener thread. Stop the returned listener on
+    shutdown to flush any queued records.
+
+    Args:
+        target_logger: Logger whose records are routed through the queue
+        level: Level to set on the logger
+
+    Returns:
+        The started listener
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    target_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    target_logger.setLevel(level)
+    target_logger.propagate = False
+
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
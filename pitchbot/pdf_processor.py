@@ -4,6 +4,7 @@ PDF Processor for PitchBot
 Handles processing of PDF documents using the PDFIngest system for key point extraction.
 """
 
+import asyncio
 import tempfile
 import os
 import json
@@ -13,6 +14,7 @@ from pathlib import Path
 from datetime import datetime
 
 from .pdf_ingest import PDFIngest
+from .upload_utils import save_upload
 
 
 async def process_pdf(pdf_document: Optional[UploadFile]) -> str:
@@ -34,22 +36,23 @@ async def process_pdf(pdf_document: Optional[UploadFile]) -> str:
     with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_pdf:
         try:
             # Write PDF content to temp file
-            content = await pdf_document.read()
-            temp_pdf.write(content)
-            temp_pdf.flush()
             pdf_path = temp_pdf.name
+            await save_upload(pdf_document, temp_pdf)
 
             print(f"🔍 Extracting key points from PDF (including image analysis)...")
             
-            # Initialize the PDFIngest system
+            # Initialize the PDFIngest system (off the event loop, like the processing below)
             try:
-                ingest = PDFIngest()
+                ingest = await asyncio.to_thread(PDFIngest)
             except Exception as e:
                 return f"❌ Failed to initialize PDFIngest: {e}"
 
-            # Process the PDF with Llama and image extraction
+            # Process the PDF with Llama and image extraction; this is synchronous
+            # network and CPU work, so run it in a thread to keep other requests moving
             try:
-                result = ingest.process_pdf(pdf_path, process_with_llama=True, extract_images=True)
+                result = await asyncio.to_thread(
+                    ingest.process_pdf, pdf_path, process_with_llama=True, extract_images=True
+                )
                 
                 if not result["success"]:
                     return f"❌ PDF processing failed: {result['errors']}"
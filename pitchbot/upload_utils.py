@@ -0,0 +1,30 @@
+"""
+Upload helpers for PitchBot
+
+Shared handling of files uploaded to the API before they reach a processor.
+"""
+
+import asyncio
+import shutil
+from typing import BinaryIO
+
+from fastapi import UploadFile
+
+# Bytes copied per read when saving an upload, so memory stays flat for large videos
+UPLOAD_COPY_CHUNK_BYTES = 1024 * 1024
+
+
+async def save_upload(upload: UploadFile, destination: BinaryIO) -> None:
+    """
+    Copy an uploaded file into an open binary file.
+
+    The upload is copied in fixed-size chunks on a worker thread instead of
+    being read into memory in one piece, so the event loop stays free while
+    large files are written out.
+
+    Args:
+        upload: The uploaded file
+        destination: File opened for binary writing
+    """
+    await asyncio.to_thread(shutil.copyfileobj, upload.file, destination, UPLOAD_COPY_CHUNK_BYTES)
+    destination.flush()